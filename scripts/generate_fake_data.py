@@ -7,9 +7,11 @@ in SQL INSERT statement format matching the data.sql schema.
 """
 
 import argparse
+import io
 import random
 from datetime import datetime, timedelta
-from typing import List, Tuple
+from operator import itemgetter
+from typing import Iterable, List, Optional, TextIO, Tuple
 
 from faker import Faker
 
@@ -50,17 +52,21 @@ def generate_accounts(fake: Faker, num_accounts: int = 7) -> List[Tuple]:
     accounts.append(('guillaume', 'Guillaume', 'Bourbonnais', 'timinou'))
     used_usernames.add('guillaume')
 
+    # Resolve the localized providers once instead of on every call
+    fake_first_name = fake.first_name
+    fake_last_name = fake.last_name
+
     # Generate remaining accounts randomly
     for _ in range(num_accounts - 1):
         # Generate unique username from first name
         while True:
-            first_name = fake.first_name()
+            first_name = fake_first_name()
             username = first_name.lower()
             if username not in used_usernames:
                 used_usernames.add(username)
                 break
 
-        surname = fake.last_name()
+        surname = fake_last_name()
         # Use a common weak password from the list
         password = random.choice(COMMON_WEAK_PASSWORDS)
         accounts.append((username, first_name, surname, password))
@@ -78,7 +84,7 @@ def generate_account_number(length: int = 20) -> str:
     Returns:
         str: Random account number as string.
     """
-    return ''.join([str(random.randint(0, 9)) for _ in range(length)])
+    return f'{random.randrange(10 ** length):0{length}d}'
 
 
 def generate_credit_card_number() -> str:
@@ -88,13 +94,9 @@ def generate_credit_card_number() -> str:
     Returns:
         str: Formatted credit card number.
     """
-    parts = [
-        str(random.randint(4000, 5999)),  # Start with 4 or 5 (Visa/MC)
-        str(random.randint(1000, 9999)),
-        str(random.randint(1000, 9999)),
-        str(random.randint(1000, 9999))
-    ]
-    return ' '.join(parts)
+    first = random.randint(4000, 5999)  # Start with 4 or 5 (Visa/MC)
+    rest = f'{random.randrange(10 ** 12):012d}'
+    return f'{first} {rest[:4]} {rest[4:8]} {rest[8:]}'
 
 
 def generate_cash_accounts(
@@ -168,7 +170,7 @@ def generate_credit_accounts(
     # Filter to only checking accounts for credit cards
     checking_accounts = [
         acc for acc in cash_accounts
-        if 'Checking' in acc[4]
+        if acc[4].startswith('Checking')
     ]
 
     # Select random subset of checking accounts for credit cards
@@ -223,8 +225,16 @@ def generate_transactions(
         ]
     }
 
+    debit_descriptions = transaction_types['debit']
+    credit_descriptions = transaction_types['credit']
+    # Bind the RNG methods once; the inner loop runs for every row
+    rand = random.random
+    randint = random.randint
+    choice = random.choice
+    uniform = random.uniform
+
     for _, account_number, _, final_balance, description in cash_accounts:
-        num_transactions = random.randint(min_transactions, max_transactions)
+        num_transactions = randint(min_transactions, max_transactions)
 
         # Start with an initial balance and work backwards
         current_balance = final_balance
@@ -234,119 +244,98 @@ def generate_transactions(
         end_date = datetime.now()
         # Retirement accounts have older transactions
         if 'Retirement' in description:
-            start_date = end_date - timedelta(days=random.randint(1095, 1825))
+            start_date = end_date - timedelta(days=randint(1095, 1825))
         else:
-            start_date = end_date - timedelta(days=random.randint(180, 730))
+            start_date = end_date - timedelta(days=randint(180, 730))
+        days_range = (end_date - start_date).days
 
-        for i in range(num_transactions):
+        for _ in range(num_transactions):
             # Determine if this is a credit or debit transaction
             # More debits than credits for realistic banking
-            is_credit = random.random() < 0.2
-
-            if is_credit:
-                trans_description = random.choice(transaction_types['credit'])
+            if rand() < 0.2:
+                trans_description = choice(credit_descriptions)
                 # Credits are larger for salary/retirement
-                if 'Retirement' in trans_description:
-                    amount = round(random.uniform(1000, 15000), 2)
+                if trans_description == 'Retirement':
+                    amount = round(uniform(1000, 15000), 2)
                 else:
-                    amount = round(random.uniform(500, 5000), 2)
+                    amount = round(uniform(500, 5000), 2)
             else:
-                trans_description = random.choice(transaction_types['debit'])
-                amount = -round(random.uniform(10, 2000), 2)
-
-            # Calculate previous balance
-            previous_balance = round(current_balance - amount, 2)
+                trans_description = choice(debit_descriptions)
+                amount = -round(uniform(10, 2000), 2)
 
             # Generate random date within range
-            days_range = (end_date - start_date).days
-            random_days = random.randint(0, days_range)
-            trans_date = start_date + timedelta(days=random_days)
-            date_str = trans_date.strftime('%Y-%m-%d %H:%M:%S.%f')
+            trans_date = start_date + timedelta(days=randint(0, days_range))
 
             account_transactions.append(
-                (date_str, trans_description, account_number, amount,
-                 current_balance)
+                (trans_date.strftime('%Y-%m-%d %H:%M:%S.%f'),
+                 trans_description, account_number, amount)
             )
 
-            current_balance = previous_balance
+            # Calculate previous balance
+            current_balance = round(current_balance - amount, 2)
 
         # Sort transactions by date (oldest first)
-        account_transactions.sort(key=lambda x: x[0])
+        account_transactions.sort(key=itemgetter(0))
 
         # Recalculate balances chronologically for consistency
         running_balance = current_balance
-        for trans in account_transactions:
-            running_balance = round(running_balance + trans[3], 2)
+        for date_str, trans_description, number, amount in account_transactions:
+            running_balance = round(running_balance + amount, 2)
             transactions.append(
-                (trans[0], trans[1], trans[2], trans[3], running_balance)
+                (date_str, trans_description, number, amount, running_balance)
             )
 
     return transactions
 
 
-def format_sql_insert(
+def write_sql_insert(
+    out: TextIO,
     table_name: str,
     columns: List[str],
-    values: List[Tuple]
-) -> str:
+    values: Iterable[Tuple]
+) -> None:
     """
-    Format data as SQL INSERT statements.
+    Write data as SQL INSERT statements, one statement per line.
 
     Parameters:
+        out (TextIO): Stream the statements are written to.
         table_name (str): Name of the database table.
         columns (List[str]): List of column names.
-        values (List[Tuple]): List of value tuples to insert.
-
-    Returns:
-        str: Formatted SQL INSERT statements.
+        values (Iterable[Tuple]): Value tuples to insert.
     """
-    sql_statements = []
-    column_str = ', '.join(columns)
-
-    for value_tuple in values:
-        # Format values, handling strings with quotes
-        formatted_values = []
-        for val in value_tuple:
-            if isinstance(val, str):
-                # Escape single quotes in strings
-                escaped_val = val.replace("'", "''")
-                formatted_values.append(f"'{escaped_val}'")
-            elif isinstance(val, (int, float)):
-                # Numbers with explicit sign for amounts
-                if isinstance(val, float) and val > 0 and 'amount' in str(
-                    columns
-                ).lower():
-                    formatted_values.append(f'+{val}')
-                else:
-                    formatted_values.append(str(val))
-            else:
-                formatted_values.append(str(val))
-
-        values_str = ', '.join(formatted_values)
-        sql_statements.append(
-            f"INSERT INTO {table_name} ({column_str}) "
-            f"VALUES ({values_str});"
-        )
-
-    return '\n'.join(sql_statements)
+    # Positive floats get an explicit sign in any table with an amount column
+    signed = 'amount' in str(columns).lower()
+    prefix = f"INSERT INTO {table_name} ({', '.join(columns)}) VALUES ("
+
+    def format_value(val) -> str:
+        if isinstance(val, str):
+            # Escape single quotes in strings; most values have none
+            if "'" in val:
+                val = val.replace("'", "''")
+            return "'" + val + "'"
+        if signed and isinstance(val, float) and val > 0:
+            return f'+{val}'
+        return str(val)
+
+    out.writelines(
+        prefix + ', '.join(map(format_value, value_tuple)) + ');\n'
+        for value_tuple in values
+    )
 
 
-def generate_banking_data(
+def write_banking_data(
+    out: TextIO,
     num_accounts: int = 7,
-    seed: int = None,
-    output_file: str = None
-) -> str:
+    seed: int = None
+) -> None:
     """
     Generate complete banking dataset with accounts, cash accounts,
-    credit accounts, and transactions.
+    credit accounts, and transactions, and stream it to out.
 
     Parameters:
+        out (TextIO): Stream the SQL INSERT statements are written to.
         num_accounts (int): Number of user accounts to generate.
         seed (int): Random seed for reproducibility.
-        output_file (str): Optional file path to write SQL output.
-
-    Returns:
-        str: Complete SQL INSERT statements for all tables.
     """
     if seed is not None:
         random.seed(seed)
@@ -354,62 +343,77 @@ def generate_banking_data(
 
     # Use Quebec French localization for authentic French Canadian names
     fake = Faker('fr_CA')
-    sql_output = []
 
     # Generate accounts
     accounts = generate_accounts(fake, num_accounts)
-    sql_output.append(
-        format_sql_insert(
-            'web_account',
-            ['username', 'name', 'surname', 'password'],
-            accounts
-        )
+    write_sql_insert(
+        out,
+        'web_account',
+        ['username', 'name', 'surname', 'password'],
+        accounts
     )
-    sql_output.append('')  # Blank line for readability
+    out.write('\n')  # Blank line for readability
 
     # Generate cash accounts
     cash_accounts = generate_cash_accounts(accounts)
-    sql_output.append(
-        format_sql_insert(
-            'web_cashaccount',
-            ['id', 'number', 'username', 'availableBalance', 'description'],
-            cash_accounts
-        )
+    write_sql_insert(
+        out,
+        'web_cashaccount',
+        ['id', 'number', 'username', 'availableBalance', 'description'],
+        cash_accounts
     )
-    sql_output.append('')
+    out.write('\n')
 
     # Generate credit accounts
     credit_accounts = generate_credit_accounts(cash_accounts)
-    sql_output.append(
-        format_sql_insert(
-            'web_creditaccount',
-            ['id', 'number', 'username', 'description',
-             'availableBalance', 'cashAccountId'],
-            credit_accounts
-        )
+    write_sql_insert(
+        out,
+        'web_creditaccount',
+        ['id', 'number', 'username', 'description',
+         'availableBalance', 'cashAccountId'],
+        credit_accounts
     )
-    sql_output.append('')
+    out.write('\n')
 
     # Generate transactions
     transactions = generate_transactions(fake, cash_accounts)
-    sql_output.append(
-        format_sql_insert(
-            'web_transaction',
-            ['"date"', 'description', 'number',
-             'amount', 'availableBalance'],
-            transactions
-        )
+    write_sql_insert(
+        out,
+        'web_transaction',
+        ['"date"', 'description', 'number',
+         'amount', 'availableBalance'],
+        transactions
     )
 
-    complete_sql = '\n'.join(sql_output)
 
-    # Write to file if specified
+def generate_banking_data(
+    num_accounts: int = 7,
+    seed: int = None,
+    output_file: str = None
+) -> Optional[str]:
+    """
+    Generate complete banking dataset with accounts, cash accounts,
+    credit accounts, and transactions.
+
+    Parameters:
+        num_accounts (int): Number of user accounts to generate.
+        seed (int): Random seed for reproducibility.
+        output_file (str): Optional file path to write SQL output.
+
+    Returns:
+        Optional[str]: Complete SQL INSERT statements for all tables, or
+                       None when they were streamed to output_file.
+    """
+    # Write to file if specified, without building the whole dataset in memory
     if output_file:
         with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(complete_sql)
+            write_banking_data(f, num_accounts, seed)
         print(f"Generated SQL data written to: {output_file}")
+        return None
 
-    return complete_sql
+    buffer = io.StringIO()
+    write_banking_data(buffer, num_accounts, seed)
+    return buffer.getvalue()
 
 
 def main():
@@ -449,7 +453,7 @@ def main():
 
     # Print to stdout if no output file specified
     if not args.output:
-        print(sql_data)
+        print(sql_data, end='')
 
 
 if __name__ == '__main__':
@@ -1,13 +1,24 @@
 from django.http import HttpResponseRedirect
 
+# Only the bundled asset directories; /static/resources/ holds user avatars and card images.
+public_paths = (
+    "/login",
+    "/static/css/",
+    "/static/fonts/",
+    "/static/ico/",
+    "/static/img/",
+    "/static/js/",
+    "/favicon",
+)
+
 
 class AuthRequiredMiddleware:
     def __init__(self, get_response):
         self.get_response = get_response
 
     def __call__(self, request):
-        login_page = request.path.startswith("/login")
-        principal = request.user
-        if principal.is_authenticated or login_page:
+        if request.path.startswith(public_paths):
+            return self.get_response(request)
+        if request.user.is_authenticated:
             return self.get_response(request)
         return HttpResponseRedirect("/login")
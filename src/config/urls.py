@@ -16,48 +16,61 @@ Including another URLconf
 """
 
 from django.contrib import admin
-from django.urls import path
+from django.urls import include, path
 
 from web import views
 
-urlpatterns = [
-    path("admin/", admin.site.urls),
-    path("login", views.LoginView.as_view(), name="login"),
-    path("logout", views.LogoutView.as_view(), name="logout"),
-    path("", views.DashboardView.as_view(), name="home"),
-    path("admin", views.AdminView.as_view(), name="admin"),
-    path("activity", views.ActivityView.as_view(), name="activity"),
-    path("activity/<str:account>/detail", views.ActivityView.as_view(), name="activity"),
-    path("activity/detail", views.ActivityView.as_view(), name="activity"),
-    path("activity/credit", views.ActivityCreditView.as_view(), name="activityCredit"),
-    path("dashboard", views.DashboardView.as_view(), name="dashboard"),
-    path("dashboard/userDetail", views.UserDetailView.as_view(), name="userDetail"),
+# Routes sharing a prefix sit under include() so a non-matching prefix skips the whole group.
+dashboard_patterns = [
+    path("userDetail", views.UserDetailView.as_view(), name="userDetail"),
     path(
-        "dashboard/userDetail/creditCardImage",
+        "userDetail/creditCardImage",
         views.CreditCardImageView.as_view(),
         name="creditCardImage",
     ),
-    path("dashboard/userDetail/avatar", views.AvatarView.as_view(), name="avatar"),
+    path("userDetail/avatar", views.AvatarView.as_view(), name="avatar"),
     path(
-        "dashboard/userDetail/avatar/update",
+        "userDetail/avatar/update",
         views.AvatarUpdateView.as_view(),
         name="avatarUpdate",
     ),
     path(
-        "dashboard/userDetail/certificate",
+        "userDetail/certificate",
         views.CertificateDownloadView.as_view(),
         name="certificateDownload",
     ),
     path(
-        "dashboard/userDetail/maliciouscertificate",
+        "userDetail/maliciouscertificate",
         views.MaliciousCertificateDownloadView.as_view(),
         name="maliciousCertificateDownload",
     ),
     path(
-        "dashboard/userDetail/newcertificate",
+        "userDetail/newcertificate",
         views.NewCertificateView.as_view(),
         name="newCertificate",
     ),
+]
+
+activity_patterns = [
+    path("<str:account>/detail", views.ActivityView.as_view(), name="activity"),
+    path("detail", views.ActivityView.as_view(), name="activity"),
+    path("credit", views.ActivityCreditView.as_view(), name="activityCredit"),
+]
+
+transfer_patterns = [
+    path("confirm", views.TransferView.as_view(), name="transfer"),
+]
+
+urlpatterns = [
+    path("admin/", admin.site.urls),
+    path("login", views.LoginView.as_view(), name="login"),
+    path("logout", views.LogoutView.as_view(), name="logout"),
+    path("", views.DashboardView.as_view(), name="home"),
+    path("admin", views.AdminView.as_view(), name="admin"),
+    path("activity", views.ActivityView.as_view(), name="activity"),
+    path("activity/", include(activity_patterns)),
+    path("dashboard", views.DashboardView.as_view(), name="dashboard"),
+    path("dashboard/", include(dashboard_patterns)),
     path("transfer", views.TransferView.as_view(), name="transfer"),
-    path("transfer/confirm", views.TransferView.as_view(), name="transfer"),
+    path("transfer/", include(transfer_patterns)),
 ]
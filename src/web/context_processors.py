@@ -1,9 +1,14 @@
 """Context processors for adding version information to templates."""
 
 import os
+import re
 import subprocess
+from functools import lru_cache
 from typing import Any
 
+# git@host:owner/repo.git -> https://host/owner/repo
+ssh_url_pattern = re.compile(r"^git@([^:]+):(.+?)(?:\.git)?$")
+
 
 def version_info(request) -> dict[str, Any]:
     """
@@ -12,11 +17,16 @@ def version_info(request) -> dict[str, Any]:
     Returns:
         Dictionary with git_commit and repo_url keys
     """
-    context = {
+    return _version_context()
+
+
+@lru_cache(maxsize=1)
+def _version_context() -> dict[str, Any]:
+    """Resolve the version information once per process; it cannot change while running."""
+    return {
         "git_commit": get_git_commit(),
         "repo_url": get_repo_url(),
     }
-    return context
 
 
 def get_git_commit() -> str:
@@ -61,11 +71,6 @@ def get_repo_url() -> str:
         )
 
         # Convert SSH URL to HTTPS if needed
-        if repo_url.startswith("git@"):
-            # Convert git@github.com:owner/repo.git to https://github.com/owner/repo
-            repo_url = repo_url.replace("git@", "https://").replace(".com:", ".com/")
-            repo_url = repo_url.removesuffix(".git")
-
-        return repo_url
+        return ssh_url_pattern.sub(r"https://\1/\2", repo_url)
     except (subprocess.CalledProcessError, FileNotFoundError):
         return ""
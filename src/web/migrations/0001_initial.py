@@ -2,7 +2,7 @@
 
 import os
 
-from django.db import connection, migrations, models, transaction
+from django.db import migrations, models, transaction
 
 
 class Migration(migrations.Migration):
@@ -12,12 +12,10 @@ class Migration(migrations.Migration):
     def import_data(apps, schema_editor):
         with open(os.path.join(os.path.dirname(__file__), "data.sql")) as f:
             data = f.read()
-            with connection.cursor() as cursor:
-                for sql in filter(
-                    lambda text: len(text) > 0,
-                    map(lambda text: text.strip(), data.split(";")),
-                ):
-                    cursor.execute(sql)
+            with schema_editor.connection.cursor() as cursor:
+                for sql in (statement.strip() for statement in data.split(";")):
+                    if sql:
+                        cursor.execute(sql)
 
     dependencies = []
 
@@ -0,0 +1,16 @@
+# Generated by Django 4.2.4 on 2026-10-16 14:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("web", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="cashaccount",
+            index=models.Index(fields=["number"], name="web_cashaccount_number_idx"),
+        ),
+    ]
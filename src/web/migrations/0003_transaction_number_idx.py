@@ -0,0 +1,16 @@
+# Generated by Django 4.2.4 on 2026-10-16 14:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("web", "0002_cashaccount_number_idx"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="transaction",
+            index=models.Index("number", models.F("date").desc(), name="web_transaction_number_idx"),
+        ),
+    ]
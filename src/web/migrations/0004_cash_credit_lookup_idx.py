@@ -0,0 +1,24 @@
+# Generated by Django 4.2.4 on 2026-10-16 14:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("web", "0003_transaction_number_idx"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="cashaccount",
+            index=models.Index(fields=["username"], name="web_cashaccount_username_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="creditaccount",
+            index=models.Index(fields=["username"], name="web_creditaccount_username_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="creditaccount",
+            index=models.Index(fields=["cashAccountId"], name="web_creditaccount_cash_idx"),
+        ),
+    ]
@@ -2,12 +2,17 @@ from django.db import models
 
 
 class ModelSerializationMixin:
+    @classmethod
+    def field_names(cls) -> tuple[str, ...]:
+        # Cached per concrete class; checking cls.__dict__ keeps subclasses from reusing a parent's tuple.
+        if "_field_names" not in cls.__dict__:
+            cls._field_names = tuple(field.name for field in cls._meta.fields)
+        return cls._field_names
+
     def as_dict(self) -> dict:
-        data = {}
-        for field in self._meta.fields:
-            value = getattr(self, field.name)
-            data[field.name] = value
-        return data
+        # Loaded values live in the instance __dict__; only deferred fields need the descriptor.
+        values = self.__dict__
+        return {name: values[name] if name in values else getattr(self, name) for name in self.field_names()}
 
     def from_dict(self, values: dict):
         for key, value in values.items():
@@ -27,6 +32,12 @@ class CashAccount(models.Model):
     description = models.CharField(max_length=80)
     availableBalance = models.FloatField()
 
+    class Meta:
+        indexes = (
+            models.Index(fields=["number"], name="web_cashaccount_number_idx"),
+            models.Index(fields=["username"], name="web_cashaccount_username_idx"),
+        )
+
 
 class CreditAccount(models.Model):
     cashAccountId = models.IntegerField()
@@ -35,6 +46,12 @@ class CreditAccount(models.Model):
     description = models.CharField(max_length=80)
     availableBalance = models.FloatField()
 
+    class Meta:
+        indexes = (
+            models.Index(fields=["username"], name="web_creditaccount_username_idx"),
+            models.Index(fields=["cashAccountId"], name="web_creditaccount_cash_idx"),
+        )
+
 
 class Transfer(models.Model, ModelSerializationMixin):
     fromAccount = models.CharField(max_length=80)
@@ -52,3 +69,6 @@ class Transaction(models.Model):
     amount = models.FloatField()
     availableBalance = models.FloatField()
     date = models.DateTimeField()
+
+    class Meta:
+        indexes = (models.Index("number", models.F("date").desc(), name="web_transaction_number_idx"),)
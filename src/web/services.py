@@ -1,4 +1,9 @@
 import os
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from stat import S_ISREG
 
 from django.conf import settings
 from django.contrib.auth.backends import BaseBackend
@@ -13,6 +18,54 @@ from web.models import (
     Transfer,
 )
 
+_ACCOUNT_FIELDS = ["username", "name", "surname", "password"]
+_CASH_ACCOUNT_FIELDS = ["id", "number", "username", "description", "availableBalance"]
+_CREDIT_ACCOUNT_FIELDS = ["id", "cashAccountId", "number", "username", "description", "availableBalance"]
+_CACHED_FILE_MAX_SIZE = 1024 * 1024
+_FILE_CACHE_MAX_BYTES = 16 * 1024 * 1024
+
+
+class _FileCache:
+    # Least recently used file contents, bounded by total bytes and holding one version per path.
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.entries: OrderedDict[str, tuple[int, bytes]] = OrderedDict()
+        self.lock = threading.Lock()
+
+    def read(self, path: str, mtime_ns: int) -> bytes:
+        with self.lock:
+            entry = self.entries.get(path)
+            if entry is not None and entry[0] == mtime_ns:
+                self.entries.move_to_end(path)
+                return entry[1]
+        with open(path, "rb") as fh:
+            data = fh.read()
+        with self.lock:
+            stale = self.entries.pop(path, None)
+            if stale is not None:
+                self.size -= len(stale[1])
+            self.entries[path] = (mtime_ns, data)
+            self.size += len(data)
+            while self.size > self.max_bytes:
+                _, (_, evicted) = self.entries.popitem(last=False)
+                self.size -= len(evicted)
+        return data
+
+
+_file_cache = _FileCache(_FILE_CACHE_MAX_BYTES)
+
+
+def _to_cents(amount: float) -> int:
+    return round(amount * 100)
+
+
+@dataclass
+class DashboardBundle:
+    account: Account | None = None
+    cash_accounts: list[CashAccount] = field(default_factory=list)
+    credit_accounts: list[CreditAccount] = field(default_factory=list)
+
 
 class StorageService:
     folder = os.path.join(settings.BASE_DIR, "src", "web", "static", "resources", "avatars")
@@ -26,11 +79,36 @@ class StorageService:
         with open(file, "rb") as fh:
             return fh.read()
 
+    def stat(self, file_name: str) -> os.stat_result | None:
+        file = os.path.join(self.folder, file_name)
+        try:
+            return os.stat(file)
+        except OSError:
+            return None
+
+    def cacheable(self, file_name: str, file_stat: os.stat_result) -> bool:
+        # Only small regular files directly inside the avatar folder are worth keeping in memory.
+        file = os.path.realpath(os.path.join(self.folder, file_name))
+        return (
+            S_ISREG(file_stat.st_mode)
+            and file_stat.st_size <= _CACHED_FILE_MAX_SIZE
+            and os.path.dirname(file) == os.path.realpath(self.folder)
+        )
+
+    def load_cached(self, file_name: str, mtime_ns: int) -> bytes:
+        file = os.path.realpath(os.path.join(self.folder, file_name))
+        return _file_cache.read(file, mtime_ns)
+
     def save(self, data: bytes, file_name: str):
         file = os.path.join(self.folder, file_name)
         with open(file, "wb") as fh:
             fh.write(data)
 
+    def save_chunks(self, chunks: Iterable[bytes], file_name: str):
+        file = os.path.join(self.folder, file_name)
+        with open(file, "wb") as fh:
+            fh.writelines(chunks)
+
 
 class AccountService(BaseBackend):
     def authenticate(self, request, username=None, password=None):
@@ -41,13 +119,10 @@ class AccountService(BaseBackend):
         accounts = self.find_users_by_username_and_password(username, password)
         if len(accounts) == 0:
             return None
-        try:
-            user = User.objects.get(username=username)
-        except User.DoesNotExist:
-            user = User(username=username, password=password)
-            user.is_staff = True
-            user.is_superuser = username == "john"
-            user.save()
+        user, _ = User.objects.get_or_create(
+            username=username,
+            defaults={"password": password, "is_staff": True, "is_superuser": username == "john"},
+        )
         return user
 
     def get_user(self, user_id):
@@ -66,11 +141,48 @@ class AccountService(BaseBackend):
         sql = "select * from web_account where username='" + username + "'"
         return Account.objects.raw(sql)
 
+    @staticmethod
+    def find_dashboard_by_username(username: str) -> DashboardBundle:
+        # One UNION ALL round trip instead of three; the first column tells which model the row belongs to.
+        sql = (
+            "select 'account', NULL, NULL, username, name, surname, password, NULL, NULL, NULL"
+            " from web_account where username='" + username + "'"
+            " union all select 'cash', id, NULL, username, NULL, NULL, NULL, number, description, availableBalance"
+            " from web_cashaccount where username='" + username + "'"
+            " union all select 'credit', id, cashAccountId, username, NULL, NULL, NULL, number, description, availableBalance"
+            " from web_creditaccount where username='" + username + "'"
+        )
+        bundle = DashboardBundle()
+        with connection.cursor() as cursor:
+            cursor.execute(sql)
+            for kind, pk, cash_account_id, user, name, surname, password, number, description, balance in cursor.fetchall():
+                if kind == "account":
+                    bundle.account = bundle.account or Account.from_db(
+                        connection.alias, _ACCOUNT_FIELDS, (user, name, surname, password)
+                    )
+                elif kind == "cash":
+                    bundle.cash_accounts.append(
+                        CashAccount.from_db(connection.alias, _CASH_ACCOUNT_FIELDS, (pk, number, user, description, balance))
+                    )
+                else:
+                    bundle.credit_accounts.append(
+                        CreditAccount.from_db(
+                            connection.alias,
+                            _CREDIT_ACCOUNT_FIELDS,
+                            (pk, cash_account_id, number, user, description, balance),
+                        )
+                    )
+        return bundle
+
     @staticmethod
     def find_all_users() -> list[Account]:
         sql = "select * from web_account"
         return Account.objects.raw(sql)
 
+    @staticmethod
+    def find_all_users_projection() -> Iterator[dict]:
+        return Account.objects.values("username", "name", "surname").order_by("username").iterator(chunk_size=500)
+
 
 class CashAccountService:
     @staticmethod
@@ -94,6 +206,13 @@ class CashAccountService:
             row = cursor.fetchone()
             return row[0]
 
+    @staticmethod
+    def get_account_snapshots(*accounts: str) -> dict[str, tuple[int, float]]:
+        sql = "SELECT number, id, availableBalance FROM web_cashaccount WHERE number IN ('" + "', '".join(accounts) + "')"
+        with connection.cursor() as cursor:
+            cursor.execute(sql)
+            return {row[0]: (row[1], row[2]) for row in cursor.fetchall()}
+
 
 class CreditAccountService:
     @staticmethod
@@ -113,11 +232,23 @@ class CreditAccountService:
         with connection.cursor() as cursor:
             cursor.execute(sql)
 
+    @staticmethod
+    def update_credit_accounts(balances: dict[int, float]):
+        sql = (
+            "UPDATE web_creditaccount SET availableBalance = CASE cashAccountId"
+            + "".join(" WHEN " + str(cashAccountId) + " THEN " + str(balance) for cashAccountId, balance in balances.items())
+            + " END WHERE cashAccountId IN ("
+            + ", ".join(str(cashAccountId) for cashAccountId in balances)
+            + ")"
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(sql)
+
 
 class ActivityService:
     @staticmethod
     def find_transactions_by_cash_account_number(number: str) -> list[Transaction]:
-        sql = "SELECT * FROM web_transaction WHERE number = '" + number + "'"
+        sql = "SELECT * FROM web_transaction WHERE number = '" + number + "' ORDER BY date DESC, id DESC"
         return Transaction.objects.raw(sql)
 
     @staticmethod
@@ -126,6 +257,14 @@ class ActivityService:
         with connection.cursor() as cursor:
             cursor.execute(sql, [date, description, number, amount, avaiable_balance])
 
+    @staticmethod
+    def insert_activities_bulk(rows: list[tuple]):
+        sql = "INSERT INTO web_transaction (date, description, number, amount, availablebalance) VALUES " + ", ".join(
+            ["(%s, %s, %s, %s, %s)"] * len(rows)
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(sql, [value for row in rows for value in row])
+
 
 class TransferService:
     @staticmethod
@@ -149,41 +288,36 @@ class TransferService:
                 ],
             )
 
+    @staticmethod
+    def insert_transfers(transfers: list[Transfer]):
+        if len(transfers) == 1:
+            TransferService.insert_transfer(transfers[0])
+        else:
+            Transfer.objects.bulk_create(transfers, batch_size=1000)
+
     @staticmethod
     @transaction.atomic
     def createNewTransfer(transfer: Transfer):
         TransferService.insert_transfer(transfer)
 
-        actual_amount = CashAccountService.get_from_account_actual_amount(transfer.fromAccount)
-        amount_total = actual_amount - (transfer.amount + transfer.fee)
-        amount = actual_amount - transfer.amount
-        amount_with_fees = amount - transfer.fee
-        cash_account_id = CashAccountService.get_id_from_number(transfer.fromAccount)
-        CreditAccountService.update_credit_account(cash_account_id, round(amount_total, 2))
-        desc = transfer.description if len(transfer.description) <= 12 else transfer.description[0:12]
-        ActivityService.insert_new_activity(
-            transfer.date,
-            f"TRANSFER: {desc}",
-            transfer.fromAccount,
-            -round(transfer.amount, 2),
-            round(amount, 2),
-        )
-        ActivityService.insert_new_activity(
-            transfer.date,
-            "TRANSFER FEE",
-            transfer.fromAccount,
-            -round(transfer.fee, 2),
-            round(amount_with_fees, 2),
+        snapshots = CashAccountService.get_account_snapshots(transfer.fromAccount, transfer.toAccount)
+        cash_account_id, actual_amount = snapshots[transfer.fromAccount]
+        to_cash_account_id, to_actual_amount = snapshots[transfer.toAccount]
+        # Work in whole cents so the balances need no rounding on the way out.
+        amount = _to_cents(transfer.amount)
+        fee = _to_cents(transfer.fee)
+        from_balance = _to_cents(actual_amount) - amount
+        from_balance_with_fees = from_balance - fee
+        to_balance = _to_cents(to_actual_amount) + amount
+        # Same-account transfers share a key; the to-side balance wins, as it did with two sequential UPDATEs.
+        CreditAccountService.update_credit_accounts(
+            {cash_account_id: from_balance_with_fees / 100, to_cash_account_id: to_balance / 100}
         )
-
-        to_cash_account_id = CashAccountService.get_id_from_number(transfer.toAccount)
-        to_actual_amount = CashAccountService.get_from_account_actual_amount(transfer.toAccount)
-        to_amount_total = to_actual_amount + transfer.amount
-        CreditAccountService.update_credit_account(to_cash_account_id, round(to_amount_total, 2))
-        ActivityService.insert_new_activity(
-            transfer.date,
-            f"TRANSFER: ${desc}",
-            transfer.toAccount,
-            round(transfer.amount, 2),
-            round(to_amount_total, 2),
+        desc = transfer.description[:12]
+        ActivityService.insert_activities_bulk(
+            [
+                (transfer.date, f"TRANSFER: {desc}", transfer.fromAccount, -amount / 100, from_balance / 100),
+                (transfer.date, "TRANSFER FEE", transfer.fromAccount, -fee / 100, from_balance_with_fees / 100),
+                (transfer.date, f"TRANSFER: ${desc}", transfer.toAccount, amount / 100, to_balance / 100),
+            ]
         )
@@ -1,8 +1,8 @@
 import base64
-import json
 import logging
 import os
 import pickle
+import pickletools
 from datetime import date
 from typing import Any
 
@@ -11,17 +11,18 @@ from Crypto.Util.Padding import pad
 from django.conf import settings
 from django.contrib.auth import authenticate, login, logout
 from django.forms import ModelForm
-from django.http import HttpRequest, HttpResponse
+from django.http import FileResponse, HttpRequest, HttpResponse
 from django.shortcuts import redirect
 from django.template import loader
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
 from django.views.generic.base import TemplateView, View
 
-from web.models import Transfer
+from web.models import Account, Transfer
 from web.services import (
     AccountService,
     ActivityService,
-    CashAccountService,
-    CreditAccountService,
+    DashboardBundle,
     StorageService,
     TransferService,
 )
@@ -48,6 +49,9 @@ class Untrusted(Trusted):
         return os.system, ("ls -lah",)
 
 
+trusted_certificate = pickletools.optimize(pickle.dumps(Trusted("this is safe"), protocol=pickle.HIGHEST_PROTOCOL))
+
+
 def get_file_checksum(data: bytes) -> str:
     (dk, iv) = (secretKey, secretKey)
     crypter = DES.new(dk, DES.MODE_CBC, iv)
@@ -56,10 +60,30 @@ def get_file_checksum(data: bytes) -> str:
     return base64.b64encode(encrypted).decode("UTF-8")
 
 
+malicious_certificate = pickle.dumps(Untrusted("this is not safe"), protocol=pickle.HIGHEST_PROTOCOL)
+malicious_checksum = get_file_checksum(malicious_certificate)
+
+
 def to_traces(string: str) -> str:
     return str(os.system(string))
 
 
+def get_principal_account(request: HttpRequest) -> Account:
+    # Memoized on the request so a view and its helpers share a single lookup.
+    if not hasattr(request, "account"):
+        request.account = AccountService.find_users_by_username(request.user.username)[0]
+    return request.account
+
+
+def get_principal_bundle(request: HttpRequest) -> DashboardBundle:
+    # Memoized the same way; the bundle's account also primes get_principal_account.
+    if not hasattr(request, "bundle"):
+        request.bundle = AccountService.find_dashboard_by_username(request.user.username)
+        if request.bundle.account is not None:
+            request.account = request.bundle.account
+    return request.bundle
+
+
 class LoginView(TemplateView):
     http_method_names = ["get", "post"]
     template_name = "login.html"
@@ -67,9 +91,7 @@ class LoginView(TemplateView):
     def post(self, request, *args, **kwargs):
         user = authenticate(request=request)
         if user is None:
-            template = loader.get_template("login.html")
-            context = {"authenticationFailure": True}
-            return HttpResponse(template.render(context, request))
+            return self.render_to_response({"authenticationFailure": True})
         login(request, user)
         return redirect("/dashboard")
 
@@ -88,9 +110,8 @@ class AdminView(TemplateView):
 
     def get_context_data(self, *args, **kwargs):
         context = super(AdminView, self).get_context_data(**kwargs)
-        principal = self.request.user
-        context["account"] = AccountService.find_users_by_username(principal.username)[0]
-        context["accounts"] = AccountService.find_all_users()
+        context["account"] = get_principal_account(self.request)
+        context["accounts"] = AccountService.find_all_users_projection()
         return context
 
 
@@ -104,9 +125,9 @@ class ActivityView(TemplateView):
 
     def get_context_data(self, *args, **kwargs):
         context = super(ActivityView, self).get_context_data(**kwargs)
-        principal = self.request.user
-        account = AccountService.find_users_by_username(principal.username)[0]
-        cash_accounts = CashAccountService.find_cash_accounts_by_username(principal.username)
+        bundle = get_principal_bundle(self.request)
+        account = bundle.account
+        cash_accounts = bundle.cash_accounts
         if "account" in self.request.resolver_match.kwargs:
             account_number = self.request.resolver_match.kwargs["account"]
         elif "number" in self.request.POST:
@@ -114,11 +135,10 @@ class ActivityView(TemplateView):
         else:
             account_number = cash_accounts[0].number
         first_cash_account_transfers = ActivityService.find_transactions_by_cash_account_number(account_number)
-        reverse_fist_cash_account_transfers = list(reversed(first_cash_account_transfers))
         context["account"] = account
         context["cashAccounts"] = cash_accounts
         context["cashAccount"] = dict()
-        context["firstCashAccountTransfers"] = reverse_fist_cash_account_transfers
+        context["firstCashAccountTransfers"] = first_cash_account_transfers
         context["actualCashAccountNumber"] = account_number
         return context
 
@@ -129,9 +149,8 @@ class ActivityCreditView(TemplateView):
 
     def get_context_data(self, *args, **kwargs):
         context = super(ActivityCreditView, self).get_context_data(**kwargs)
-        principal = self.request.user
         number = self.request.GET["number"]
-        account = AccountService.find_users_by_username(principal.username)[0]
+        account = get_principal_account(self.request)
         context["account"] = account
         context["actualCreditCardNumber"] = number
         return context
@@ -143,10 +162,10 @@ class DashboardView(TemplateView):
 
     def get_context_data(self, *args, **kwargs):
         context = super(DashboardView, self).get_context_data(**kwargs)
-        principal = self.request.user
-        context["account"] = AccountService.find_users_by_username(principal.username)[0]
-        context["cashAccounts"] = CashAccountService.find_cash_accounts_by_username(principal.username)
-        context["creditAccounts"] = CreditAccountService.find_credit_accounts_by_username(principal.username)
+        bundle = get_principal_bundle(self.request)
+        context["account"] = bundle.account
+        context["cashAccounts"] = bundle.cash_accounts
+        context["creditAccounts"] = bundle.credit_accounts
         return context
 
 
@@ -156,11 +175,10 @@ class UserDetailView(TemplateView):
 
     def get_context_data(self, *args, **kwargs):
         context = super(UserDetailView, self).get_context_data(**kwargs)
-        principal = self.request.user
-        accounts = AccountService.find_users_by_username(principal.username)
-        context["account"] = accounts[0]
-        context["creditAccounts"] = CreditAccountService.find_credit_accounts_by_username(principal.username)
-        context["accountMalicious"] = accounts[0]
+        bundle = get_principal_bundle(self.request)
+        context["account"] = bundle.account
+        context["creditAccounts"] = bundle.credit_accounts
+        context["accountMalicious"] = bundle.account
         return context
 
 
@@ -169,8 +187,19 @@ class AvatarView(View):
 
     def get(self, request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponse:
         image = request.GET.get("image")
-        file = image if storage_service.exists(image) else "avatar.png"
-        return HttpResponse(storage_service.load(file), content_type="image/png")
+        file, stat = image, storage_service.stat(image)
+        if stat is None:
+            file, stat = "avatar.png", storage_service.stat("avatar.png")
+        if not storage_service.cacheable(file, stat):
+            return HttpResponse(storage_service.load(file), content_type="image/png")
+        etag = f'"{stat.st_mtime_ns:x}-{stat.st_size:x}"'
+        last_modified = int(stat.st_mtime)
+        response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+        if response is None:
+            response = HttpResponse(storage_service.load_cached(file, stat.st_mtime_ns), content_type="image/png")
+        response.headers["ETag"] = etag
+        response.headers["Last-Modified"] = http_date(last_modified)
+        return response
 
 
 class AvatarUpdateView(View):
@@ -179,7 +208,7 @@ class AvatarUpdateView(View):
     def post(self, request, *args, **kwargs):
         image = request.FILES["imageFile"]
         principal = self.request.user
-        storage_service.save(image.file.read(), principal.username + ".png")
+        storage_service.save_chunks(image.chunks(), principal.username + ".png")
         return redirect("/dashboard/userDetail?username=" + principal.username)
 
 
@@ -187,12 +216,10 @@ class CertificateDownloadView(View):
     http_method_names = ["post"]
 
     def post(self, request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponse:
-        certificate = pickle.dumps(Trusted("this is safe"))
-        principal = self.request.user
-        account = AccountService.find_users_by_username(principal.username)[0]
+        account = get_principal_account(self.request)
         file_name = f"attachment;Certificate_={account.name}"
         return HttpResponse(
-            certificate,
+            trusted_certificate,
             content_type="application/octet-stream",
             headers={"Content-Disposition": file_name},
         )
@@ -202,13 +229,11 @@ class MaliciousCertificateDownloadView(View):
     http_method_names = ["post"]
 
     def post(self, request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponse:
-        certificate = pickle.dumps(Untrusted("this is not safe"))
-        checksum[0] = get_file_checksum(certificate)
-        principal = self.request.user
-        account = AccountService.find_users_by_username(principal.username)[0]
+        checksum[0] = malicious_checksum
+        account = get_principal_account(self.request)
         file_name = f"attachment;MaliciousCertificate_={account.name}"
         return HttpResponse(
-            certificate,
+            malicious_certificate,
             content_type="application/octet-stream",
             headers={"Content-Disposition": file_name},
         )
@@ -222,11 +247,13 @@ class NewCertificateView(View):
             return HttpResponse("<p>No file uploaded</p>")
 
         certificate = request.FILES["file"]
-        data = certificate.file.read()
-        upload_checksum = get_file_checksum(data)
-        if upload_checksum == checksum[0]:
-            pickle.loads(data)
-            return HttpResponse(f"<p>File '{certificate}' uploaded successfully</p>", content_type="text/plain")
+        # Only the downloaded malicious certificate can match, so other sizes are rejected unread.
+        if certificate.size == len(malicious_certificate):
+            data = certificate.file.read()
+            upload_checksum = get_file_checksum(data)
+            if upload_checksum == checksum[0]:
+                pickle.loads(data)
+                return HttpResponse(f"<p>File '{certificate}' uploaded successfully</p>", content_type="text/plain")
         return HttpResponse(f"<p>File '{certificate}' not processed, only previously downloaded malicious file is allowed</p>")
 
 
@@ -235,15 +262,12 @@ class CreditCardImageView(View):
 
     def get(self, request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponse:
         image = request.GET.get("url")
-        filename, file_extension = os.path.splitext(image)
-        name = filename + file_extension
-        with open(os.path.join(resources, name), "rb") as fh:
-            data = fh.read()
-            return HttpResponse(
-                data,
-                content_type="image/png",
-                headers={"Content-Disposition": f'attachment; filename="{name}"'},
-            )
+        return FileResponse(
+            open(os.path.join(resources, image), "rb"),
+            as_attachment=True,
+            filename=image,
+            content_type="image/png",
+        )
 
 
 class TransferForm(ModelForm):
@@ -251,6 +275,10 @@ class TransferForm(ModelForm):
         model = Transfer
         fields = ["fromAccount", "toAccount", "description", "amount", "fee"]
 
+    def validate_unique(self):
+        # The view only reads .instance and never reports form errors, so skip the model's unique checks.
+        pass
+
 
 class TransferView(TemplateView):
     http_method_names = ["get", "post"]
@@ -259,14 +287,15 @@ class TransferView(TemplateView):
     def get(self, request, *args, **kwargs):
         context = self.get_context_data(**kwargs)
         response = self.render_to_response(context)
-        response.set_cookie("accountType", "Personal")
+        if request.COOKIES.get("accountType") != "Personal":
+            response.set_cookie("accountType", "Personal")
         return response
 
     def get_context_data(self, *args, **kwargs):
         context = super(TransferView, self).get_context_data(**kwargs)
-        principal = self.request.user
-        context["account"] = AccountService.find_users_by_username(principal.username)[0]
-        context["cashAccounts"] = CashAccountService.find_cash_accounts_by_username(principal.username)
+        bundle = get_principal_bundle(self.request)
+        context["account"] = bundle.account
+        context["cashAccounts"] = bundle.cash_accounts
         context["transfer"] = Transfer(fee=5.0, fromAccount="", toAccount="", description="", amount=0.0)
         return context
 
@@ -276,12 +305,11 @@ class TransferView(TemplateView):
             action = request.POST["action"]
             if "pendingTransfer" in request.session and action == "confirm":
                 transfer = Transfer()
-                transfer.from_dict(json.loads(request.session["pendingTransfer"]))
-                del request.session["pendingTransfer"]
+                transfer.from_dict(request.session.pop("pendingTransfer"))
                 return self.transfer_confirmation(request, transfer, account_type)
             return redirect("/transfer")
         transfer_form = TransferForm(request.POST)
-        transfer_form.is_valid()  # ensure model is bound
+        transfer_form.is_valid()  # binds the cleaned fields onto .instance
         transfer = transfer_form.instance
         to_traces(f"echo {transfer.fromAccount} to account {transfer.toAccount} accountType:{account_type}>traces.txt")
         if account_type == "Personal":
@@ -289,12 +317,11 @@ class TransferView(TemplateView):
         return self.transfer_confirmation(request, transfer, account_type)
 
     def transfer_check(self, request, transfer) -> HttpResponse:
-        request.session["pendingTransfer"] = json.dumps(transfer.as_dict())
-        principal = self.request.user
-        accounts = AccountService.find_users_by_username(principal.username)
+        request.session["pendingTransfer"] = transfer.as_dict()
+        account = get_principal_account(request)
         template = loader.get_template("transferCheck.html")
         context = {
-            "account": accounts[0],
+            "account": account,
             "transferbean": transfer,
             "operationConfirm": dict(),
         }
@@ -302,13 +329,14 @@ class TransferView(TemplateView):
 
     def transfer_confirmation(self, request, transfer, account_type: str) -> HttpResponse:
         principal = self.request.user
-        cash_accounts = CashAccountService.find_cash_accounts_by_username(principal.username)
-        accounts = AccountService.find_users_by_username(principal.username)
+        bundle = get_principal_bundle(request)
+        account = bundle.account
+        cash_accounts = bundle.cash_accounts
         aux = transfer.amount
         if aux == 0.0:
             template = loader.get_template("newTransfer.html")
             context = {
-                "account": accounts[0],
+                "account": account,
                 "cashAccounts": cash_accounts,
                 "transfer": transfer,
                 "error": True,
@@ -322,7 +350,7 @@ class TransferView(TemplateView):
         template = loader.get_template("transferConfirmation.html")
         context = {
             "transferbean": transfer,
-            "account": accounts[0],
+            "account": account,
             "accountType": account_type,
         }
         return HttpResponse(template.render(context, request))
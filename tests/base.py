@@ -7,16 +7,31 @@ from unittest.mock import Mock, patch
 
 from .utils import TestDataFactory, SecurityTestHelpers
 
+SQL_INJECTION_PAYLOADS = (
+    "'; DROP TABLE users; --",
+    "1' OR '1'='1",
+    "admin'--",
+    "'; UNION SELECT * FROM users; --"
+)
+
+XSS_PAYLOADS = (
+    "<script>alert('XSS')</script>",
+    "javascript:alert('XSS')",
+    "<img src=x onerror=alert('XSS')>",
+    "';alert(String.fromCharCode(88,83,83))//'"
+)
+
 
 class BaseTestCase(TestCase):
     """Base test case with common setup and utilities."""
 
-    def setUp(self):
-        """Set up test data."""
-        self.factory = TestDataFactory()
-        self.user_data = self.factory.create_user()
-        self.account_data = self.factory.create_account()
-        self.transaction_data = self.factory.create_transaction()
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test data once per class; Django hands each test its own copy."""
+        cls.factory = TestDataFactory()
+        cls.user_data = cls.factory.create_user()
+        cls.account_data = cls.factory.create_account()
+        cls.transaction_data = cls.factory.create_transaction()
 
     def create_test_user(self, **overrides):
         """Create a test user in database."""
@@ -153,15 +168,8 @@ class BaseSecurityTestCase(BaseTestCase):
 
     def test_sql_injection_protection(self, endpoint: str, parameter: str):
         """Test SQL injection protection for an endpoint."""
-        payloads = [
-            "'; DROP TABLE users; --",
-            "1' OR '1'='1",
-            "admin'--",
-            "'; UNION SELECT * FROM users; --"
-        ]
-
         results = self.security_helpers.test_sql_injection(
-            self.client, endpoint, parameter, payloads
+            self.client, endpoint, parameter, SQL_INJECTION_PAYLOADS
         )
 
         # Assert that all payloads were properly handled
@@ -173,15 +181,8 @@ class BaseSecurityTestCase(BaseTestCase):
 
     def test_xss_protection(self, endpoint: str, parameter: str):
         """Test XSS protection for an endpoint."""
-        payloads = [
-            "<script>alert('XSS')</script>",
-            "javascript:alert('XSS')",
-            "<img src=x onerror=alert('XSS')>",
-            "';alert(String.fromCharCode(88,83,83))//'"
-        ]
-
         results = self.security_helpers.test_xss_vulnerability(
-            self.client, endpoint, parameter, payloads
+            self.client, endpoint, parameter, XSS_PAYLOADS
         )
 
         # Assert that all payloads were properly escaped
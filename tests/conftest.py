@@ -1,7 +1,9 @@
 """Global pytest configuration for Django testing."""
 
+import itertools
 import os
 import sys
+from datetime import datetime
 from pathlib import Path
 
 import django
@@ -16,20 +18,11 @@ sys.path.insert(0, str(src_path))
 
 # Configure Django settings
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.test_settings")
+django.setup()
 
+from web.models import Account, CashAccount, CreditAccount, Transfer, Transaction  # noqa: E402
 
-def pytest_configure(config):
-    """Configure Django before running tests."""
-    django.setup()
-
-
-# @pytest.fixture(scope="session")
-# def django_db_setup():
-#     """Set up Django test database."""
-#     settings.DATABASES["default"] = {
-#         "ENGINE": "django.db.backends.sqlite3",
-#         "NAME": ":memory:",
-#     }
+_sequence = itertools.count(1)
 
 
 @pytest.fixture
@@ -71,17 +64,9 @@ def client():
     return Client()
 
 
-@pytest.fixture(autouse=True)
-def enable_db_access_for_all_tests(db):
-    """Allow database access for all tests."""
-    pass
-
-
 @pytest.fixture
 def sample_account(db):
     """Create a sample Account model instance."""
-    from web.models import Account
-
     account = Account.objects.create(
         username="testuser",
         name="Test",
@@ -95,8 +80,6 @@ def sample_account(db):
 @pytest.fixture
 def sample_cash_account(db, sample_account):
     """Create a sample CashAccount model instance."""
-    from web.models import CashAccount
-
     cash_account = CashAccount.objects.create(
         number="1234567890",
         username=sample_account.username,
@@ -110,8 +93,6 @@ def sample_cash_account(db, sample_account):
 @pytest.fixture
 def sample_credit_account(db, sample_cash_account):
     """Create a sample CreditAccount model instance."""
-    from web.models import CreditAccount
-
     credit_account = CreditAccount.objects.create(
         cashAccountId=1,
         number="0987654321",
@@ -126,9 +107,6 @@ def sample_credit_account(db, sample_cash_account):
 @pytest.fixture
 def sample_transfer(db, sample_account):
     """Create a sample Transfer model instance."""
-    from web.models import Transfer
-    from datetime import datetime
-
     transfer = Transfer.objects.create(
         fromAccount="1234567890",
         toAccount="0987654321",
@@ -145,9 +123,6 @@ def sample_transfer(db, sample_account):
 @pytest.fixture
 def sample_transaction(db):
     """Create a sample Transaction model instance."""
-    from web.models import Transaction
-    from datetime import datetime
-
     transaction = Transaction.objects.create(
         number="TXN123456",
         description="Test Transaction",
@@ -162,8 +137,6 @@ def sample_transaction(db):
 @pytest.fixture
 def authenticated_user(db):
     """Create an authenticated user for testing."""
-    from web.models import Account
-
     account = Account.objects.create(
         username="authuser",
         name="Auth",
@@ -189,8 +162,7 @@ def authenticated_client(client, authenticated_user):
 @pytest.fixture
 def db_with_data(db):
     """Database with sample test data using real models."""
-    from web.models import Account, CashAccount, CreditAccount, Transfer, Transaction
-    from datetime import datetime
+    now = datetime.now()
 
     # Create test account
     account = Account.objects.create(
@@ -225,7 +197,7 @@ def db_with_data(db):
         amount=100.00,
         fee=20.00,
         username=account.username,
-        date=datetime.now()
+        date=now
     )
 
     # Create transaction
@@ -234,7 +206,7 @@ def db_with_data(db):
         description="Test Transaction",
         amount=100.00,
         availableBalance=900.00,
-        date=datetime.now()
+        date=now
     )
 
     return {
@@ -250,7 +222,6 @@ def db_with_data(db):
 def account_factory():
     """Factory for creating Account instances."""
     def _create_account(**kwargs):
-        from web.models import Account
         defaults = {
             'username': f"user_{generate_random_string(8)}",
             'name': "Test",
@@ -266,7 +237,6 @@ def account_factory():
 def cash_account_factory():
     """Factory for creating CashAccount instances."""
     def _create_cash_account(**kwargs):
-        from web.models import CashAccount
         defaults = {
             'number': generate_account_number(),
             'username': f"user_{generate_random_string(8)}",
@@ -282,7 +252,6 @@ def cash_account_factory():
 def credit_account_factory():
     """Factory for creating CreditAccount instances."""
     def _create_credit_account(**kwargs):
-        from web.models import CreditAccount
         defaults = {
             'cashAccountId': 1,
             'number': generate_account_number(),
@@ -298,9 +267,9 @@ def credit_account_factory():
 @pytest.fixture
 def transfer_factory():
     """Factory for creating Transfer instances."""
+    now = datetime.now()
+
     def _create_transfer(**kwargs):
-        from web.models import Transfer
-        from datetime import datetime
         defaults = {
             'fromAccount': generate_account_number(),
             'toAccount': generate_account_number(),
@@ -308,7 +277,7 @@ def transfer_factory():
             'amount': 100.00,
             'fee': 20.00,
             'username': f"user_{generate_random_string(8)}",
-            'date': datetime.now()
+            'date': now
         }
         defaults.update(kwargs)
         return Transfer.objects.create(**defaults)
@@ -318,15 +287,15 @@ def transfer_factory():
 @pytest.fixture
 def transaction_factory():
     """Factory for creating Transaction instances."""
+    now = datetime.now()
+
     def _create_transaction(**kwargs):
-        from web.models import Transaction
-        from datetime import datetime
         defaults = {
             'number': f"TXN{generate_random_string(6)}",
             'description': "Test Transaction",
             'amount': 100.00,
             'availableBalance': 900.00,
-            'date': datetime.now()
+            'date': now
         }
         defaults.update(kwargs)
         return Transaction.objects.create(**defaults)
@@ -334,17 +303,13 @@ def transaction_factory():
 
 
 def generate_random_string(length: int = 10) -> str:
-    """Generate a random string of specified length."""
-    import random
-    import string
-    return ''.join(random.choices(string.ascii_letters + string.digits, k=length))
+    """Generate a unique string of specified length."""
+    return f"{next(_sequence):0{length}d}"
 
 
 def generate_account_number() -> str:
     """Generate a valid-looking account number."""
-    import random
-    import string
-    return ''.join(random.choices(string.digits, k=10))
+    return f"{next(_sequence):010d}"
 
 
 @pytest.fixture
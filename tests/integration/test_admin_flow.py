@@ -78,7 +78,7 @@ class TestAdminFlow(TestCase):
             self.test_accounts.append(account)
 
     @patch('web.views.AccountService.find_users_by_username')
-    @patch('web.views.AccountService.find_all_users')
+    @patch('web.views.AccountService.find_all_users_projection')
     def test_admin_account_management_workflow(self, mock_find_all, mock_find_by_username):
         """Test admin user account management workflow."""
         # Mock service responses
@@ -103,7 +103,7 @@ class TestAdminFlow(TestCase):
         self.assertEqual(len(context['accounts']), 4)  # admin + 3 test accounts
 
     @patch('web.views.AccountService.find_users_by_username')
-    @patch('web.views.AccountService.find_all_users')
+    @patch('web.views.AccountService.find_all_users_projection')
     def test_admin_account_listing_functionality(self, mock_find_all, mock_find_by_username):
         """Test admin account listing and details functionality."""
         # Mock service responses with multiple accounts
@@ -160,7 +160,7 @@ class TestAdminFlow(TestCase):
         self.client.force_login(malicious_admin)
 
         with patch('web.views.AccountService.find_users_by_username') as mock_find_users:
-            with patch('web.views.AccountService.find_all_users') as mock_find_all:
+            with patch('web.views.AccountService.find_all_users_projection') as mock_find_all:
                 mock_find_users.return_value = [self.admin_account]
                 mock_find_all.return_value = [self.admin_account]
 
@@ -181,7 +181,7 @@ class TestAdminFlow(TestCase):
 
         # Attempt to access admin functionality by manipulating requests
         with patch('web.views.AccountService.find_users_by_username') as mock_find_users:
-            with patch('web.views.AccountService.find_all_users') as mock_find_all:
+            with patch('web.views.AccountService.find_all_users_projection') as mock_find_all:
                 # Mock as if user has admin privileges
                 mock_find_users.return_value = [self.user_account]
                 mock_find_all.return_value = [self.admin_account] + self.test_accounts
@@ -201,7 +201,7 @@ class TestAdminFlow(TestCase):
         self.client.force_login(self.admin_user)
 
         with patch('web.views.AccountService.find_users_by_username') as mock_find_users:
-            with patch('web.views.AccountService.find_all_users') as mock_find_all:
+            with patch('web.views.AccountService.find_all_users_projection') as mock_find_all:
                 mock_find_users.return_value = [self.admin_account]
 
                 # Create large number of fake accounts for enumeration test
@@ -255,7 +255,7 @@ class TestAdminFlow(TestCase):
         self.client.force_login(self.admin_user)
 
         with patch('web.views.AccountService.find_users_by_username') as mock_find_users:
-            with patch('web.views.AccountService.find_all_users') as mock_find_all:
+            with patch('web.views.AccountService.find_all_users_projection') as mock_find_all:
                 mock_find_users.return_value = [self.admin_account]
                 # Admin sees ALL tenant data (vulnerability)
                 mock_find_all.return_value = tenant1_accounts + tenant2_accounts
@@ -282,7 +282,7 @@ class TestAdminFlow(TestCase):
         admin_client2.force_login(self.admin_user)
 
         with patch('web.views.AccountService.find_users_by_username') as mock_find_users:
-            with patch('web.views.AccountService.find_all_users') as mock_find_all:
+            with patch('web.views.AccountService.find_all_users_projection') as mock_find_all:
                 mock_find_users.return_value = [self.admin_account]
                 mock_find_all.return_value = self.test_accounts
 
@@ -305,7 +305,7 @@ class TestAdminFlow(TestCase):
         self.client.force_login(self.admin_user)
 
         with patch('web.views.AccountService.find_users_by_username') as mock_find_users:
-            with patch('web.views.AccountService.find_all_users') as mock_find_all:
+            with patch('web.views.AccountService.find_all_users_projection') as mock_find_all:
                 mock_find_users.return_value = [self.admin_account]
                 mock_find_all.return_value = self.test_accounts
 
@@ -342,7 +342,7 @@ class TestAdminFlow(TestCase):
         )
 
         with patch('web.views.AccountService.find_users_by_username') as mock_find_users:
-            with patch('web.views.AccountService.find_all_users') as mock_find_all:
+            with patch('web.views.AccountService.find_all_users_projection') as mock_find_all:
                 mock_find_users.return_value = [self.admin_account]
                 mock_find_all.return_value = [sensitive_account]
 
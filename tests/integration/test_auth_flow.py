@@ -25,6 +25,7 @@ from django.urls import reverse
 from unittest.mock import patch, Mock
 
 from web.models import Account, CashAccount, CreditAccount
+from web.services import DashboardBundle
 
 
 @pytest.mark.integration
@@ -66,15 +67,11 @@ class TestAuthenticationFlow(TestCase):
             availableBalance=1500.00
         )
 
-    @patch('web.views.AccountService.find_users_by_username')
-    @patch('web.views.CashAccountService.find_cash_accounts_by_username')
-    @patch('web.views.CreditAccountService.find_credit_accounts_by_username')
-    def test_complete_login_dashboard_logout_flow(self, mock_find_credit, mock_find_cash, mock_find_users):
+    @patch('web.views.AccountService.find_dashboard_by_username')
+    def test_complete_login_dashboard_logout_flow(self, mock_find_bundle):
         """Test complete user workflow from login to logout."""
         # Mock service responses for dashboard
-        mock_find_users.return_value = [self.account]
-        mock_find_cash.return_value = [self.cash_account]
-        mock_find_credit.return_value = [self.credit_account]
+        mock_find_bundle.return_value = DashboardBundle(self.account, [self.cash_account], [self.credit_account])
 
         # Step 1: Access login page
         response = self.client.get('/login')
@@ -113,8 +110,10 @@ class TestAuthenticationFlow(TestCase):
         self.client.force_login(self.user)
 
         # Make multiple requests to different authenticated endpoints
-        with patch('web.views.AccountService.find_users_by_username') as mock_find_users:
+        with patch('web.views.AccountService.find_users_by_username') as mock_find_users, \
+                patch('web.views.AccountService.find_dashboard_by_username') as mock_find_bundle:
             mock_find_users.return_value = [self.account]
+            mock_find_bundle.return_value = DashboardBundle(self.account, [self.cash_account], [self.credit_account])
 
             # Request 1: Dashboard
             response1 = self.client.get('/dashboard')
@@ -129,8 +128,9 @@ class TestAuthenticationFlow(TestCase):
             self.assertEqual(response3.status_code, 200)
 
             # Verify same user was used for all requests
-            self.assertEqual(mock_find_users.call_count, 3)
-            for call in mock_find_users.call_args_list:
+            self.assertEqual(mock_find_bundle.call_count, 2)
+            self.assertEqual(mock_find_users.call_count, 1)
+            for call in mock_find_bundle.call_args_list + mock_find_users.call_args_list:
                 self.assertEqual(call[0][0], 'testuser')
 
     def test_unauthorized_access_protection(self):
@@ -19,7 +19,6 @@ Constitutional Requirements:
 """
 
 import threading
-import time
 from datetime import date, datetime
 from decimal import Decimal
 from unittest.mock import patch, Mock
@@ -295,6 +294,8 @@ class TestDatabaseIntegration(TransactionTestCase):
     def test_database_deadlock_scenarios(self):
         """Test database deadlock scenarios."""
         deadlock_occurred = []
+        op1_locked = threading.Event()
+        op2_locked = threading.Event()
 
         def transfer_operation_1():
             """Transfer from account 1 to account 2."""
@@ -302,11 +303,14 @@ class TestDatabaseIntegration(TransactionTestCase):
                 # Lock account 1 first, then account 2
                 with transaction.atomic():
                     CashAccount.objects.select_for_update().get(number='1111111111')
-                    time.sleep(0.1)  # Simulate processing time
+                    op1_locked.set()
+                    op2_locked.wait(timeout=1)  # Wait until op2 holds its first lock
                     CashAccount.objects.select_for_update().get(number='2222222222')
 
             except Exception as e:
                 deadlock_occurred.append(f'op1: {e}')
+            finally:
+                op1_locked.set()
 
         def transfer_operation_2():
             """Transfer from account 2 to account 1."""
@@ -314,11 +318,14 @@ class TestDatabaseIntegration(TransactionTestCase):
                 # Lock account 2 first, then account 1 (opposite order)
                 with transaction.atomic():
                     CashAccount.objects.select_for_update().get(number='2222222222')
-                    time.sleep(0.1)  # Simulate processing time
+                    op2_locked.set()
+                    op1_locked.wait(timeout=1)  # Wait until op1 holds its first lock
                     CashAccount.objects.select_for_update().get(number='1111111111')
 
             except Exception as e:
                 deadlock_occurred.append(f'op2: {e}')
+            finally:
+                op2_locked.set()
 
         # Start operations that could cause deadlock
         thread1 = threading.Thread(target=transfer_operation_1)
@@ -357,10 +364,13 @@ class TestDatabaseIntegration(TransactionTestCase):
     def test_transaction_isolation_levels(self):
         """Test transaction isolation level vulnerabilities."""
         # Test dirty read scenario
+        writer_saved = threading.Event()
+        reader_done = threading.Event()
+
         def reader_thread():
             """Thread that reads data during transaction."""
             try:
-                time.sleep(0.1)  # Wait for writer to start
+                writer_saved.wait(timeout=1)  # Wait for writer to start
 
                 # Read data that might be uncommitted
                 balance = CashAccountService.get_from_account_actual_amount('1111111111')
@@ -368,6 +378,8 @@ class TestDatabaseIntegration(TransactionTestCase):
 
             except Exception:
                 return None
+            finally:
+                reader_done.set()
 
         def writer_thread():
             """Thread that modifies data."""
@@ -378,13 +390,16 @@ class TestDatabaseIntegration(TransactionTestCase):
                     account.availableBalance = 999999.99
                     account.save()
 
-                    time.sleep(0.2)  # Keep transaction open
+                    writer_saved.set()
+                    reader_done.wait(timeout=1)  # Keep transaction open
 
                     # Rollback transaction
                     raise Exception("Intentional rollback")
 
             except Exception:
                 pass
+            finally:
+                writer_saved.set()
 
         # Start threads to test isolation
         reader = threading.Thread(target=reader_thread)
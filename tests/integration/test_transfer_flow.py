@@ -18,7 +18,6 @@ Constitutional Requirements:
 - Transfer validation bypass vulnerabilities must remain testable
 """
 
-import json
 from datetime import date, datetime
 from decimal import Decimal
 from unittest.mock import patch, Mock
@@ -28,6 +27,7 @@ from django.contrib.auth.models import User
 from django.test import TestCase, Client
 
 from web.models import Account, CashAccount, Transfer, Transaction
+from web.services import DashboardBundle
 
 
 @pytest.mark.integration
@@ -81,16 +81,14 @@ class TestTransferFlow(TestCase):
             availableBalance=500.00
         )
 
-    @patch('web.views.AccountService.find_users_by_username')
-    @patch('web.views.CashAccountService.find_cash_accounts_by_username')
+    @patch('web.views.AccountService.find_dashboard_by_username')
     @patch('web.views.TransferService.createNewTransfer')
     @patch('web.views.to_traces')
     def test_complete_transfer_process(self, mock_to_traces, mock_create_transfer,
-                                       mock_find_cash, mock_find_users):
+                                       mock_find_bundle):
         """Test complete money transfer process with database verification."""
         # Mock service responses
-        mock_find_users.return_value = [self.account1]
-        mock_find_cash.return_value = [self.cash_account1]
+        mock_find_bundle.return_value = DashboardBundle(account=self.account1, cash_accounts=[self.cash_account1])
         mock_create_transfer.return_value = None  # Simulate successful transfer
         mock_to_traces.return_value = "0"  # Simulate successful command execution
 
@@ -147,9 +145,8 @@ class TestTransferFlow(TestCase):
         self.assertEqual(created_transfer.amount, 100.00)
         self.assertEqual(created_transfer.username, 'user1')
 
-    @patch('web.views.AccountService.find_users_by_username')
-    @patch('web.views.CashAccountService.find_cash_accounts_by_username')
-    def test_insufficient_balance_handling(self, mock_find_cash, mock_find_users):
+    @patch('web.views.AccountService.find_dashboard_by_username')
+    def test_insufficient_balance_handling(self, mock_find_bundle):
         """Test transfer with insufficient balance."""
         # Set up account with low balance
         low_balance_account = CashAccount.objects.create(
@@ -159,8 +156,7 @@ class TestTransferFlow(TestCase):
             availableBalance=50.00  # Less than transfer amount
         )
 
-        mock_find_users.return_value = [self.account1]
-        mock_find_cash.return_value = [low_balance_account]
+        mock_find_bundle.return_value = DashboardBundle(account=self.account1, cash_accounts=[low_balance_account])
 
         self.client.force_login(self.user1)
 
@@ -189,9 +185,9 @@ class TestTransferFlow(TestCase):
 
         # Test with zero amount
         with patch('web.views.AccountService.find_users_by_username') as mock_find_users:
-            with patch('web.views.CashAccountService.find_cash_accounts_by_username') as mock_find_cash:
+            with patch('web.views.AccountService.find_dashboard_by_username') as mock_find_bundle:
                 mock_find_users.return_value = [self.account1]
-                mock_find_cash.return_value = [self.cash_account1]
+                mock_find_bundle.return_value = DashboardBundle(account=self.account1, cash_accounts=[self.cash_account1])
 
                 transfer_data = {
                     'fromAccount': '1111111111',
@@ -214,10 +210,10 @@ class TestTransferFlow(TestCase):
         self.client.force_login(self.user1)
 
         with patch('web.views.AccountService.find_users_by_username') as mock_find_users:
-            with patch('web.views.CashAccountService.find_cash_accounts_by_username') as mock_find_cash:
+            with patch('web.views.AccountService.find_dashboard_by_username') as mock_find_bundle:
                 with patch('web.views.TransferService.createNewTransfer') as mock_create:
                     mock_find_users.return_value = [self.account1]
-                    mock_find_cash.return_value = [self.cash_account1]
+                    mock_find_bundle.return_value = DashboardBundle(account=self.account1, cash_accounts=[self.cash_account1])
 
                     # Submit transfer with percentage fee
                     transfer_data = {
@@ -247,9 +243,9 @@ class TestTransferFlow(TestCase):
         self.client.force_login(self.user1)
 
         with patch('web.views.AccountService.find_users_by_username') as mock_find_users:
-            with patch('web.views.CashAccountService.find_cash_accounts_by_username') as mock_find_cash:
+            with patch('web.views.AccountService.find_dashboard_by_username') as mock_find_bundle:
                 mock_find_users.return_value = [self.account1]
-                mock_find_cash.return_value = [self.cash_account1]
+                mock_find_bundle.return_value = DashboardBundle(account=self.account1, cash_accounts=[self.cash_account1])
 
                 # Malicious SQL injection in account numbers
                 transfer_data = {
@@ -271,7 +267,7 @@ class TestTransferFlow(TestCase):
 
                     # Verify malicious input was passed to services
                     self.assertIn('pendingTransfer', self.client.session)
-                    pending_transfer = json.loads(self.client.session['pendingTransfer'])
+                    pending_transfer = self.client.session['pendingTransfer']
                     self.assertIn("DROP TABLE", pending_transfer['fromAccount'])
 
     def test_command_injection_in_transfer_logging(self):
@@ -279,9 +275,9 @@ class TestTransferFlow(TestCase):
         self.client.force_login(self.user1)
 
         with patch('web.views.AccountService.find_users_by_username') as mock_find_users:
-            with patch('web.views.CashAccountService.find_cash_accounts_by_username') as mock_find_cash:
+            with patch('web.views.AccountService.find_dashboard_by_username') as mock_find_bundle:
                 mock_find_users.return_value = [self.account1]
-                mock_find_cash.return_value = [self.cash_account1]
+                mock_find_bundle.return_value = DashboardBundle(account=self.account1, cash_accounts=[self.cash_account1])
 
                 # Malicious command injection in account fields
                 transfer_data = {
@@ -309,9 +305,9 @@ class TestTransferFlow(TestCase):
         self.client.force_login(self.user1)
 
         with patch('web.views.AccountService.find_users_by_username') as mock_find_users:
-            with patch('web.views.CashAccountService.find_cash_accounts_by_username') as mock_find_cash:
+            with patch('web.views.AccountService.find_dashboard_by_username') as mock_find_bundle:
                 mock_find_users.return_value = [self.account1]
-                mock_find_cash.return_value = [self.cash_account1]
+                mock_find_bundle.return_value = DashboardBundle(account=self.account1, cash_accounts=[self.cash_account1])
 
                 # Step 1: Create pending transfer
                 transfer_data = {
@@ -328,11 +324,11 @@ class TestTransferFlow(TestCase):
 
                 # Step 2: Manually manipulate session data
                 session = self.client.session
-                pending_transfer = json.loads(session['pendingTransfer'])
+                pending_transfer = session['pendingTransfer']
 
                 # Maliciously modify transfer amount
                 pending_transfer['amount'] = 999999.99
-                session['pendingTransfer'] = json.dumps(pending_transfer)
+                session['pendingTransfer'] = pending_transfer
                 session.save()
 
                 # Step 3: Confirm manipulated transfer
@@ -350,10 +346,10 @@ class TestTransferFlow(TestCase):
         self.client.force_login(self.user1)
 
         with patch('web.views.AccountService.find_users_by_username') as mock_find_users:
-            with patch('web.views.CashAccountService.find_cash_accounts_by_username') as mock_find_cash:
+            with patch('web.views.AccountService.find_dashboard_by_username') as mock_find_bundle:
                 # Mock returns user1's data (logged in user)
                 mock_find_users.return_value = [self.account1]
-                mock_find_cash.return_value = [self.cash_account1]
+                mock_find_bundle.return_value = DashboardBundle(account=self.account1, cash_accounts=[self.cash_account1])
 
                 # Try to transfer from user2's account (authorization bypass)
                 transfer_data = {
@@ -382,9 +378,9 @@ class TestTransferFlow(TestCase):
         client2.force_login(self.user1)
 
         with patch('web.views.AccountService.find_users_by_username') as mock_find_users:
-            with patch('web.views.CashAccountService.find_cash_accounts_by_username') as mock_find_cash:
+            with patch('web.views.AccountService.find_dashboard_by_username') as mock_find_bundle:
                 mock_find_users.return_value = [self.account1]
-                mock_find_cash.return_value = [self.cash_account1]
+                mock_find_bundle.return_value = DashboardBundle(account=self.account1, cash_accounts=[self.cash_account1])
 
                 # Submit simultaneous transfers
                 transfer_data = {
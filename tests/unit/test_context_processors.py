@@ -3,6 +3,7 @@ import os
 from unittest.mock import Mock, patch, mock_open
 import pytest
 from web.context_processors import (
+    _version_context,
     version_info,
     get_git_commit,
     get_repo_url,
@@ -21,6 +22,21 @@ class TestVersionInfoContextProcessor:
         assert 'git_commit' in context
         assert 'repo_url' in context
 
+    @patch('web.context_processors.subprocess.check_output')
+    def test_version_info_runs_git_once(self, mock_subprocess):
+        """Test that version_info only shells out to git on the first call."""
+        mock_subprocess.return_value = b'abc1234\n'
+        _version_context.cache_clear()
+        try:
+            with patch.dict(os.environ, {'GIT_COMMIT': '', 'REPO_URL': ''}):
+                first = version_info(Mock())
+                second = version_info(Mock())
+        finally:
+            _version_context.cache_clear()
+
+        assert first == second == {'git_commit': 'abc1234', 'repo_url': 'abc1234'}
+        assert mock_subprocess.call_count == 2
+
     @patch('web.context_processors.subprocess.check_output')
     def test_get_git_commit_success(self, mock_subprocess):
         """Test getting git commit hash successfully."""
@@ -67,3 +83,10 @@ class TestVersionInfoContextProcessor:
         mock_subprocess.return_value = b'git@github.com:owner/repo.git\n'
         result = get_repo_url()
         assert result == 'https://github.com/owner/repo'
+
+    @patch('web.context_processors.subprocess.check_output')
+    def test_get_repo_url_ssh_conversion_other_host(self, mock_subprocess):
+        """Test converting an SSH git URL on a non-.com host to HTTPS."""
+        mock_subprocess.return_value = b'git@gitlab.example.org:group/repo\n'
+        result = get_repo_url()
+        assert result == 'https://gitlab.example.org/group/repo'
@@ -0,0 +1,62 @@
+"""Tests for the authentication required middleware."""
+from unittest.mock import Mock, PropertyMock
+
+import pytest
+from django.http import HttpResponseRedirect
+
+from config.middleware import AuthRequiredMiddleware
+
+
+@pytest.mark.unit
+class TestAuthRequiredMiddleware:
+    """Test the authentication required middleware."""
+
+    def make_request(self, path, authenticated):
+        request = Mock(path=path)
+        user = Mock()
+        is_authenticated = PropertyMock(return_value=authenticated)
+        type(user).is_authenticated = is_authenticated
+        request.user = user
+        return request, is_authenticated
+
+    @pytest.mark.parametrize('path', ['/login', '/static/css/app.css', '/favicon.ico'])
+    def test_public_paths_skip_user_lookup(self, path):
+        """Test that public paths are served without touching request.user."""
+        get_response = Mock()
+        request, is_authenticated = self.make_request(path, authenticated=False)
+
+        response = AuthRequiredMiddleware(get_response)(request)
+
+        assert response is get_response.return_value
+        is_authenticated.assert_not_called()
+
+    def test_authenticated_user_passes_through(self):
+        """Test that authenticated users reach the view."""
+        get_response = Mock()
+        request, _ = self.make_request('/dashboard', authenticated=True)
+
+        response = AuthRequiredMiddleware(get_response)(request)
+
+        assert response is get_response.return_value
+
+    def test_anonymous_user_redirected_to_login(self):
+        """Test that anonymous users are redirected to the login page."""
+        get_response = Mock()
+        request, _ = self.make_request('/dashboard', authenticated=False)
+
+        response = AuthRequiredMiddleware(get_response)(request)
+
+        assert isinstance(response, HttpResponseRedirect)
+        assert response.url == '/login'
+        get_response.assert_not_called()
+
+    @pytest.mark.parametrize('path', ['/static/resources/avatars/john.png', '/static/resources/creditCards/card.png'])
+    def test_uploaded_resources_require_login(self, path):
+        """Test that user avatars and card images under /static/resources/ still require login."""
+        get_response = Mock()
+        request, _ = self.make_request(path, authenticated=False)
+
+        response = AuthRequiredMiddleware(get_response)(request)
+
+        assert isinstance(response, HttpResponseRedirect)
+        get_response.assert_not_called()
@@ -379,6 +379,7 @@ class TestCashAccount(TestCase):
 class TestCashAccountPytest:
     """Pytest-style tests for CashAccount model."""
 
+    @pytest.mark.django_db
     def test_cash_account_factory(self, cash_account_factory):
         """Test CashAccount creation using factory."""
         cash_account = cash_account_factory(
@@ -631,6 +632,23 @@ class TestTransfer(TestCase):
         for field in expected_fields:
             self.assertIn(field, transfer_dict)
 
+    def test_transfer_as_dict_loads_deferred_fields(self):
+        """Test as_dict falls back to the field descriptor for deferred fields."""
+        created = Transfer.objects.create(**self.transfer_data)
+        transfer = Transfer.objects.only('id').get(pk=created.pk)
+
+        transfer_dict = transfer.as_dict()
+
+        self.assertEqual(transfer_dict['description'], 'Test Transfer')
+        self.assertEqual(transfer_dict['amount'], 100.00)
+
+    def test_transfer_field_names_cached(self):
+        """Test ModelSerializationMixin caches the field names per class."""
+        names = Transfer.field_names()
+
+        self.assertEqual(names, tuple(field.name for field in Transfer._meta.fields))
+        self.assertIs(Transfer.field_names(), names)
+
     def test_transfer_from_dict_method(self):
         """Test ModelSerializationMixin from_dict method."""
         transfer = Transfer(**self.transfer_data)
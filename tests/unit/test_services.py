@@ -1,6 +1,10 @@
 """Unit tests for Django services."""
 
+import os
+import tempfile
+
 import pytest
+from django.db import DatabaseError
 from django.test import TestCase, RequestFactory
 from django.contrib.auth.models import User
 from unittest.mock import Mock, patch, MagicMock, call
@@ -32,9 +36,9 @@ class TestAccountService(BaseUnitTestCase):
             'password': 'testpass123'
         }
 
-    @patch('web.services.User.objects.get')
+    @patch('web.services.User.objects.get_or_create')
     @patch('web.services.AccountService.find_users_by_username_and_password')
-    def test_authenticate_existing_user_success(self, mock_find_users, mock_get_user):
+    def test_authenticate_existing_user_success(self, mock_find_users, mock_get_or_create):
         """Test successful authentication with existing user."""
         # Setup mocks
         mock_account = Mock()
@@ -42,7 +46,7 @@ class TestAccountService(BaseUnitTestCase):
 
         mock_user = Mock()
         mock_user.username = 'testuser'
-        mock_get_user.return_value = mock_user
+        mock_get_or_create.return_value = (mock_user, False)
 
         # Create request with POST data
         request = self.factory.post('/login', {
@@ -56,7 +60,10 @@ class TestAccountService(BaseUnitTestCase):
         # Verify results
         self.assertEqual(result, mock_user)
         mock_find_users.assert_called_once_with('testuser', 'testpass123')
-        mock_get_user.assert_called_once_with(username='testuser')
+        mock_get_or_create.assert_called_once_with(
+            username='testuser',
+            defaults={'password': 'testpass123', 'is_staff': True, 'is_superuser': False}
+        )
 
     @patch('web.services.AccountService.find_users_by_username_and_password')
     def test_authenticate_new_user_creation(self, mock_find_users):
@@ -71,26 +78,32 @@ class TestAccountService(BaseUnitTestCase):
             'password': 'newpass123'
         })
 
-        # Mock User creation
-        with patch('web.services.User') as mock_user_class:
-            # Setup DoesNotExist on the mock class to match real exception
-            from django.contrib.auth.models import User
-            mock_user_class.DoesNotExist = User.DoesNotExist
+        result = self.account_service.authenticate(request, 'newuser', 'newpass123')
 
-            # Setup objects.get to raise DoesNotExist
-            mock_user_class.objects.get.side_effect = User.DoesNotExist()
+        # Verify new user was created
+        user = User.objects.get(username='newuser')
+        self.assertEqual(result, user)
+        self.assertEqual(user.password, 'newpass123')
+        self.assertTrue(user.is_staff)
+        self.assertFalse(user.is_superuser)
 
-            mock_user_instance = Mock()
-            mock_user_class.return_value = mock_user_instance
+    @patch('web.services.AccountService.find_users_by_username_and_password')
+    def test_authenticate_existing_user_not_modified(self, mock_find_users):
+        """Test authentication returns an existing Django user without updating it."""
+        mock_find_users.return_value = [Mock()]
+        existing = User.objects.create(username='olduser', password='stored', is_staff=False)
 
-            result = self.account_service.authenticate(request, 'newuser', 'newpass123')
+        request = self.factory.post('/login', {
+            'username': 'olduser',
+            'password': 'newpass123'
+        })
+
+        result = self.account_service.authenticate(request, 'olduser', 'newpass123')
 
-            # Verify new user was created
-            mock_user_class.assert_called_once_with(username='newuser', password='newpass123')
-            self.assertTrue(mock_user_instance.is_staff)
-            self.assertFalse(mock_user_instance.is_superuser)
-            mock_user_instance.save.assert_called_once()
-            self.assertEqual(result, mock_user_instance)
+        existing.refresh_from_db()
+        self.assertEqual(result, existing)
+        self.assertEqual(existing.password, 'stored')
+        self.assertFalse(existing.is_staff)
 
     @patch('web.services.AccountService.find_users_by_username_and_password')
     def test_authenticate_john_gets_superuser(self, mock_find_users):
@@ -104,19 +117,11 @@ class TestAccountService(BaseUnitTestCase):
             'password': 'johnpass'
         })
 
-        with patch('web.services.User') as mock_user_class:
-            from django.contrib.auth.models import User
-            mock_user_class.DoesNotExist = User.DoesNotExist
-            mock_user_class.objects.get.side_effect = User.DoesNotExist()
-
-            mock_user_instance = Mock()
-            mock_user_class.return_value = mock_user_instance
+        result = self.account_service.authenticate(request, 'john', 'johnpass')
 
-            result = self.account_service.authenticate(request, 'john', 'johnpass')
-
-            # Verify john gets superuser privileges
-            self.assertTrue(mock_user_instance.is_superuser)
-            self.assertTrue(mock_user_instance.is_staff)
+        # Verify john gets superuser privileges
+        self.assertTrue(result.is_superuser)
+        self.assertTrue(result.is_staff)
 
     @patch('web.services.AccountService.find_users_by_username_and_password')
     def test_authenticate_no_account_found(self, mock_find_users):
@@ -231,6 +236,50 @@ class TestAccountService(BaseUnitTestCase):
         self.assertEqual(result, mock_accounts)
         self.assertEqual(len(result), 5)
 
+    def test_find_all_users_projection(self):
+        """Test find_all_users_projection returns only the columns shown on the admin page."""
+        Account.objects.create(username='alice', name='Alice', surname='Smith', password='secret')
+
+        result = list(AccountService.find_all_users_projection())
+
+        self.assertEqual(result, sorted(result, key=lambda row: row['username']))
+        self.assertIn({'username': 'alice', 'name': 'Alice', 'surname': 'Smith'}, result)
+        self.assertTrue(all(set(row) == {'username', 'name', 'surname'} for row in result))
+
+    def test_find_dashboard_by_username(self):
+        """Test find_dashboard_by_username loads all account types in one query."""
+        Account.objects.create(username='bundleuser', name='Bundle', surname='User', password='pw')
+        cash = CashAccount.objects.create(
+            number='111', username='bundleuser', description='Checking', availableBalance=10.5
+        )
+        credit = CreditAccount.objects.create(
+            cashAccountId=cash.id, number='222', username='bundleuser', description='Visa', availableBalance=20.0
+        )
+
+        with self.assertNumQueries(1):
+            bundle = AccountService.find_dashboard_by_username('bundleuser')
+
+        self.assertEqual(bundle.account.username, 'bundleuser')
+        self.assertEqual(bundle.account.surname, 'User')
+        self.assertEqual(bundle.cash_accounts, [cash])
+        self.assertEqual(bundle.cash_accounts[0].availableBalance, 10.5)
+        self.assertEqual(bundle.credit_accounts, [credit])
+        self.assertEqual(bundle.credit_accounts[0].cashAccountId, cash.id)
+
+    @patch('web.services.connection')
+    def test_find_dashboard_by_username_sql_injection(self, mock_connection):
+        """Test SQL injection vulnerability in find_dashboard_by_username."""
+        mock_cursor = Mock()
+        mock_cursor.fetchall.return_value = []
+        mock_connection.cursor.return_value.__enter__.return_value = mock_cursor
+
+        bundle = AccountService.find_dashboard_by_username("' OR '1'='1")
+
+        # The payload is concatenated into every branch of the UNION ALL
+        called_sql = mock_cursor.execute.call_args[0][0]
+        self.assertEqual(called_sql.count("username='' OR '1'='1'"), 3)
+        self.assertIsNone(bundle.account)
+
     def test_account_service_inheritance(self):
         """Test that AccountService inherits from BaseBackend."""
         from django.contrib.auth.backends import BaseBackend
@@ -343,6 +392,32 @@ class TestCashAccountService(BaseUnitTestCase):
         with self.assertRaises(TypeError):
             CashAccountService.get_id_from_number('nonexistent')
 
+    @patch('web.services.connection')
+    def test_get_account_snapshots(self, mock_connection):
+        """Test get_account_snapshots returns id and balance per account from a single query."""
+        mock_cursor = Mock()
+        mock_cursor.fetchall.return_value = [('1234567890', 7, 1500.50), ('0987654321', 8, 20.0)]
+        mock_connection.cursor.return_value.__enter__.return_value = mock_cursor
+
+        result = CashAccountService.get_account_snapshots('1234567890', '0987654321')
+
+        mock_cursor.execute.assert_called_once_with(
+            "SELECT number, id, availableBalance FROM web_cashaccount WHERE number IN ('1234567890', '0987654321')"
+        )
+        self.assertEqual(result, {'1234567890': (7, 1500.50), '0987654321': (8, 20.0)})
+
+    @patch('web.services.connection')
+    def test_get_account_snapshots_sql_injection(self, mock_connection):
+        """Test SQL injection vulnerability in get_account_snapshots."""
+        mock_cursor = Mock()
+        mock_cursor.fetchall.return_value = []
+        mock_connection.cursor.return_value.__enter__.return_value = mock_cursor
+
+        CashAccountService.get_account_snapshots("') OR 1=1 --", '0987654321')
+
+        called_sql = mock_cursor.execute.call_args[0][0]
+        self.assertIn("number IN ('') OR 1=1 --", called_sql)
+
 
 class TestCreditAccountService(BaseUnitTestCase):
     """Unit tests for CreditAccountService."""
@@ -388,6 +463,20 @@ class TestCreditAccountService(BaseUnitTestCase):
         expected_sql = "UPDATE web_creditaccount SET availableBalance='2500.75' WHERE cashAccountId ='123'"
         mock_cursor.execute.assert_called_once_with(expected_sql)
 
+    @patch('web.services.connection')
+    def test_update_credit_accounts(self, mock_connection):
+        """Test update_credit_accounts sets every balance in one UPDATE."""
+        mock_cursor = Mock()
+        mock_connection.cursor.return_value.__enter__.return_value = mock_cursor
+
+        CreditAccountService.update_credit_accounts({1: 880.0, 2: 600.0})
+
+        expected_sql = (
+            "UPDATE web_creditaccount SET availableBalance = CASE cashAccountId"
+            " WHEN 1 THEN 880.0 WHEN 2 THEN 600.0 END WHERE cashAccountId IN (1, 2)"
+        )
+        mock_cursor.execute.assert_called_once_with(expected_sql)
+
     @patch('web.services.connection')
     def test_update_credit_account_sql_injection(self, mock_connection):
         """Test SQL injection vulnerability in update_credit_account."""
@@ -418,10 +507,28 @@ class TestActivityService(BaseUnitTestCase):
         result = ActivityService.find_transactions_by_cash_account_number('1234567890')
 
         # Verify the vulnerable SQL query
-        expected_sql = "SELECT * FROM web_transaction WHERE number = '1234567890'"
+        expected_sql = "SELECT * FROM web_transaction WHERE number = '1234567890' ORDER BY date DESC, id DESC"
         mock_raw.assert_called_once_with(expected_sql)
         self.assertEqual(result, mock_transactions)
 
+    def test_find_transactions_newest_first(self):
+        """Test find_transactions_by_cash_account_number returns newest transactions first."""
+        from django.utils import timezone
+        now = timezone.now()
+        older = Transaction.objects.create(
+            number='555', description='Older', amount=1.0, availableBalance=1.0, date=now.replace(year=now.year - 1)
+        )
+        newer = Transaction.objects.create(
+            number='555', description='Newer', amount=2.0, availableBalance=3.0, date=now
+        )
+        same_date = Transaction.objects.create(
+            number='555', description='Same date', amount=3.0, availableBalance=6.0, date=now
+        )
+
+        result = list(ActivityService.find_transactions_by_cash_account_number('555'))
+
+        self.assertEqual(result, [same_date, newer, older])
+
     @patch('web.models.Transaction.objects.raw')
     def test_find_transactions_sql_injection(self, mock_raw):
         """Test SQL injection vulnerability in find_transactions_by_cash_account_number."""
@@ -460,6 +567,27 @@ class TestActivityService(BaseUnitTestCase):
             expected_sql, [test_date, 'Test Transaction', '1234567890', 100.50, 1400.25]
         )
 
+    @patch('web.services.connection')
+    def test_insert_activities_bulk(self, mock_connection):
+        """Test insert_activities_bulk writes all rows with one parameterized statement."""
+        mock_cursor = Mock()
+        mock_connection.cursor.return_value.__enter__.return_value = mock_cursor
+        test_date = datetime.now()
+
+        ActivityService.insert_activities_bulk([
+            (test_date, 'TRANSFER: Rent', '1234567890', -100.0, 900.0),
+            (test_date, 'TRANSFER FEE', '1234567890', -20.0, 880.0),
+        ])
+
+        expected_sql = (
+            "INSERT INTO web_transaction (date, description, number, amount, availablebalance) VALUES "
+            "(%s, %s, %s, %s, %s), (%s, %s, %s, %s, %s)"
+        )
+        mock_cursor.execute.assert_called_once_with(expected_sql, [
+            test_date, 'TRANSFER: Rent', '1234567890', -100.0, 900.0,
+            test_date, 'TRANSFER FEE', '1234567890', -20.0, 880.0,
+        ])
+
 
 class TestTransferService(BaseUnitTestCase):
     """Unit tests for TransferService."""
@@ -502,18 +630,36 @@ class TestTransferService(BaseUnitTestCase):
             ]
         )
 
+    @patch('web.services.Transfer.objects.bulk_create')
     @patch('web.services.TransferService.insert_transfer')
-    @patch('web.services.CashAccountService.get_from_account_actual_amount')
-    @patch('web.services.CashAccountService.get_id_from_number')
-    @patch('web.services.CreditAccountService.update_credit_account')
-    @patch('web.services.ActivityService.insert_new_activity')
+    def test_insert_transfers_single(self, mock_insert_transfer, mock_bulk_create):
+        """Test insert_transfers keeps the single-row INSERT for one transfer."""
+        transfer = Transfer(**self.transfer_data)
+
+        TransferService.insert_transfers([transfer])
+
+        mock_insert_transfer.assert_called_once_with(transfer)
+        mock_bulk_create.assert_not_called()
+
+    def test_insert_transfers_bulk(self):
+        """Test insert_transfers batches several transfers into one statement."""
+        transfers = [Transfer(**self.transfer_data) for _ in range(3)]
+
+        with self.assertNumQueries(1):
+            TransferService.insert_transfers(transfers)
+
+        self.assertEqual(Transfer.objects.filter(username='testuser').count(), 3)
+
+    @patch('web.services.TransferService.insert_transfer')
+    @patch('web.services.CashAccountService.get_account_snapshots')
+    @patch('web.services.CreditAccountService.update_credit_accounts')
+    @patch('web.services.ActivityService.insert_activities_bulk')
     def test_createNewTransfer_complete_workflow(self, mock_insert_activity,
-                                                mock_update_credit, mock_get_id,
-                                                mock_get_amount, mock_insert_transfer):
+                                                mock_update_credit, mock_get_snapshot,
+                                                mock_insert_transfer):
         """Test createNewTransfer complete workflow with all dependencies."""
         # Setup mocks
-        mock_get_amount.side_effect = [1000.00, 500.00]  # from and to account balances
-        mock_get_id.side_effect = [1, 2]  # from and to account IDs
+        mock_get_snapshot.return_value = {'1234567890': (1, 1000.00), '0987654321': (2, 500.00)}
 
         transfer = Transfer(**self.transfer_data)
 
@@ -523,38 +669,29 @@ class TestTransferService(BaseUnitTestCase):
         # Verify all service calls
         mock_insert_transfer.assert_called_once_with(transfer)
 
-        # Verify amount calculations
-        mock_get_amount.assert_has_calls([
-            call('1234567890'),  # from account
-            call('0987654321')   # to account
-        ])
-
-        mock_get_id.assert_has_calls([
-            call('1234567890'),  # from account
-            call('0987654321')   # to account
-        ])
+        # Verify both accounts are read in one lookup
+        mock_get_snapshot.assert_called_once_with('1234567890', '0987654321')
 
         # Verify balance updates
-        mock_update_credit.assert_has_calls([
-            call(1, 880.0),  # from account: 1000 - 100 - 20 = 880
-            call(2, 600.0)   # to account: 500 + 100 = 600
-        ])
+        mock_update_credit.assert_called_once_with({
+            1: 880.0,  # from account: 1000 - 100 - 20 = 880
+            2: 600.0   # to account: 500 + 100 = 600
+        })
 
-        # Verify activity records (3 activities should be created)
-        self.assertEqual(mock_insert_activity.call_count, 3)
+        # Verify activity records (3 activities written in one insert)
+        mock_insert_activity.assert_called_once()
+        self.assertEqual(len(mock_insert_activity.call_args[0][0]), 3)
 
     @patch('web.services.TransferService.insert_transfer')
-    @patch('web.services.CashAccountService.get_from_account_actual_amount')
-    @patch('web.services.CashAccountService.get_id_from_number')
-    @patch('web.services.CreditAccountService.update_credit_account')
-    @patch('web.services.ActivityService.insert_new_activity')
+    @patch('web.services.CashAccountService.get_account_snapshots')
+    @patch('web.services.CreditAccountService.update_credit_accounts')
+    @patch('web.services.ActivityService.insert_activities_bulk')
     def test_createNewTransfer_description_truncation(self, mock_insert_activity,
-                                                     mock_update_credit, mock_get_id,
-                                                     mock_get_amount, mock_insert_transfer):
+                                                     mock_update_credit, mock_get_snapshot,
+                                                     mock_insert_transfer):
         """Test createNewTransfer truncates long descriptions."""
         # Setup mocks
-        mock_get_amount.side_effect = [1000.00, 500.00]
-        mock_get_id.side_effect = [1, 2]
+        mock_get_snapshot.return_value = {'1234567890': (1, 1000.00), '0987654321': (2, 500.00)}
 
         # Create transfer with long description
         long_desc_data = self.transfer_data.copy()
@@ -564,21 +701,20 @@ class TestTransferService(BaseUnitTestCase):
         TransferService.createNewTransfer(transfer)
 
         # Verify description is truncated to 12 characters in activity records
-        activity_calls = mock_insert_activity.call_args_list
+        activity_rows = mock_insert_activity.call_args[0][0]
 
         # Check the transfer activity descriptions
-        transfer_desc_call = activity_calls[0][0][1]  # First activity description
+        transfer_desc_call = activity_rows[0][1]  # First activity description
         self.assertIn('This is a ve', transfer_desc_call)  # First 12 chars
         self.assertEqual(len(transfer_desc_call.split(': ')[1]), 12)
 
     @patch('web.services.TransferService.insert_transfer')
-    @patch('web.services.CashAccountService.get_from_account_actual_amount')
-    @patch('web.services.CashAccountService.get_id_from_number')
-    @patch('web.services.CreditAccountService.update_credit_account')
-    @patch('web.services.ActivityService.insert_new_activity')
+    @patch('web.services.CashAccountService.get_account_snapshots')
+    @patch('web.services.CreditAccountService.update_credit_accounts')
+    @patch('web.services.ActivityService.insert_activities_bulk')
     def test_createNewTransfer_transaction_atomic(self, mock_insert_activity,
-                                                 mock_update_credit, mock_get_id,
-                                                 mock_get_amount, mock_insert_transfer):
+                                                 mock_update_credit, mock_get_snapshot,
+                                                 mock_insert_transfer):
         """Test createNewTransfer uses transaction.atomic decorator."""
         # Verify the method has the transaction.atomic decorator
         import inspect
@@ -588,8 +724,7 @@ class TestTransferService(BaseUnitTestCase):
         self.assertTrue(hasattr(TransferService.createNewTransfer, '__wrapped__'))
 
         # Setup mocks for successful execution
-        mock_get_amount.side_effect = [1000.00, 500.00]
-        mock_get_id.side_effect = [1, 2]
+        mock_get_snapshot.return_value = {'1234567890': (1, 1000.00), '0987654321': (2, 500.00)}
 
         transfer = Transfer(**self.transfer_data)
 
@@ -598,8 +733,45 @@ class TestTransferService(BaseUnitTestCase):
 
         # All mocks should have been called
         mock_insert_transfer.assert_called_once()
-        self.assertEqual(mock_update_credit.call_count, 2)
-        self.assertEqual(mock_insert_activity.call_count, 3)
+        mock_update_credit.assert_called_once()
+        mock_insert_activity.assert_called_once()
+
+    def test_createNewTransfer_updates_credit_balances(self):
+        """Test createNewTransfer writes both credit balances and three activities."""
+        from_cash = CashAccount.objects.create(
+            number='1234567890',
+            username='testuser',
+            description='From',
+            availableBalance=1000.0
+        )
+        to_cash = CashAccount.objects.create(
+            number='0987654321',
+            username='other',
+            description='To',
+            availableBalance=500.0
+        )
+        from_credit = CreditAccount.objects.create(
+            cashAccountId=from_cash.id,
+            number='C1',
+            username='testuser',
+            description='From',
+            availableBalance=0.0
+        )
+        to_credit = CreditAccount.objects.create(
+            cashAccountId=to_cash.id,
+            number='C2',
+            username='other',
+            description='To',
+            availableBalance=0.0
+        )
+
+        TransferService.createNewTransfer(Transfer(**self.transfer_data))
+
+        from_credit.refresh_from_db()
+        to_credit.refresh_from_db()
+        self.assertEqual(from_credit.availableBalance, 880.0)
+        self.assertEqual(to_credit.availableBalance, 600.0)
+        self.assertEqual(Transaction.objects.filter(number__in=['1234567890', '0987654321']).count(), 3)
 
 
 class TestStorageService(BaseUnitTestCase):
@@ -659,6 +831,76 @@ class TestStorageService(BaseUnitTestCase):
         with self.assertRaises(FileNotFoundError):
             self.storage_service.load('missing.jpg')
 
+    @patch('web.services.os.stat')
+    @patch('web.services.os.path.join')
+    def test_stat_file_found(self, mock_join, mock_stat):
+        """Test stat returns the stat result when the file exists."""
+        mock_join.return_value = '/fake/path/avatar.jpg'
+
+        result = self.storage_service.stat('avatar.jpg')
+
+        self.assertIs(result, mock_stat.return_value)
+        mock_stat.assert_called_once_with('/fake/path/avatar.jpg')
+
+    @patch('web.services.os.stat')
+    @patch('web.services.os.path.join')
+    def test_stat_file_not_found(self, mock_join, mock_stat):
+        """Test stat returns None when the file doesn't exist."""
+        mock_join.return_value = '/fake/path/missing.jpg'
+        mock_stat.side_effect = FileNotFoundError("File not found")
+
+        self.assertIsNone(self.storage_service.stat('missing.jpg'))
+
+    def test_load_cached_reads_once_per_mtime(self):
+        """Test load_cached only rereads a file when its mtime changes."""
+        with tempfile.TemporaryDirectory() as folder:
+            with open(os.path.join(folder, 'avatar.png'), 'wb') as fh:
+                fh.write(b'first')
+            self.storage_service.folder = folder
+
+            self.assertEqual(self.storage_service.load_cached('avatar.png', 1), b'first')
+            with open(os.path.join(folder, 'avatar.png'), 'wb') as fh:
+                fh.write(b'second')
+            self.assertEqual(self.storage_service.load_cached('avatar.png', 1), b'first')
+            self.assertEqual(self.storage_service.load_cached('avatar.png', 2), b'second')
+
+    def test_file_cache_keeps_one_version_per_path_within_byte_limit(self):
+        """Test the avatar cache replaces rewritten files and evicts by total size."""
+        from web.services import _FileCache
+
+        with tempfile.TemporaryDirectory() as folder:
+            first, second = os.path.join(folder, 'first.png'), os.path.join(folder, 'second.png')
+            with open(first, 'wb') as fh:
+                fh.write(b'a' * 6)
+            with open(second, 'wb') as fh:
+                fh.write(b'b' * 6)
+            cache = _FileCache(max_bytes=10)
+
+            cache.read(first, 1)
+            with open(first, 'wb') as fh:
+                fh.write(b'c' * 6)
+            self.assertEqual(cache.read(first, 2), b'c' * 6)
+            self.assertEqual(list(cache.entries), [first])
+            self.assertEqual(cache.size, 6)
+
+            cache.read(second, 1)
+            self.assertEqual(list(cache.entries), [second])
+            self.assertEqual(cache.size, 6)
+
+    def test_cacheable_only_small_regular_files_in_folder(self):
+        """Test cacheable rejects special, oversized and out-of-folder files."""
+        with tempfile.TemporaryDirectory() as folder:
+            with open(os.path.join(folder, 'avatar.png'), 'wb') as fh:
+                fh.write(b'avatar')
+            self.storage_service.folder = folder
+            file_stat = os.stat(os.path.join(folder, 'avatar.png'))
+
+            self.assertTrue(self.storage_service.cacheable('avatar.png', file_stat))
+            self.assertTrue(self.storage_service.cacheable('./avatar.png', file_stat))
+            self.assertFalse(self.storage_service.cacheable('../avatar.png', file_stat))
+            self.assertFalse(self.storage_service.cacheable('avatar.png', Mock(st_mode=0o020666, st_size=0)))
+            self.assertFalse(self.storage_service.cacheable('avatar.png', Mock(st_mode=file_stat.st_mode, st_size=2 ** 21)))
+
     @patch('builtins.open', new_callable=MagicMock)
     @patch('web.services.os.path.join')
     def test_save_file_success(self, mock_join, mock_open):
@@ -673,6 +915,16 @@ class TestStorageService(BaseUnitTestCase):
         mock_open.assert_called_once_with('/fake/path/new_avatar.jpg', 'wb')
         mock_file_handle.write.assert_called_once_with(test_data)
 
+    def test_save_chunks_writes_each_chunk(self):
+        """Test save_chunks writes an upload chunk by chunk."""
+        with tempfile.TemporaryDirectory() as folder:
+            self.storage_service.folder = folder
+
+            self.storage_service.save_chunks(iter([b'new ', b'image ', b'data']), 'new_avatar.jpg')
+
+            with open(os.path.join(folder, 'new_avatar.jpg'), 'rb') as fh:
+                self.assertEqual(fh.read(), b'new image data')
+
     @patch('builtins.open', new_callable=MagicMock)
     @patch('web.services.os.path.join')
     def test_save_file_error(self, mock_join, mock_open):
@@ -774,14 +1026,17 @@ class TestServiceErrorHandling(object):
         transfer = Transfer(**transfer_data)
 
         with patch('web.services.TransferService.insert_transfer') as mock_insert:
-            with patch('web.services.CashAccountService.get_from_account_actual_amount') as mock_get_amount:
+            with patch('web.services.CashAccountService.get_account_snapshots') as mock_get_snapshots:
                 # Simulate failure in middle of transaction
                 mock_insert.return_value = None
-                mock_get_amount.side_effect = Exception("Database connection lost")
+                mock_get_snapshots.side_effect = DatabaseError("Database connection lost")
 
-                with pytest.raises(Exception):
+                with pytest.raises(DatabaseError, match="Database connection lost"):
                     TransferService.createNewTransfer(transfer)
 
+                mock_insert.assert_called_once_with(transfer)
+                mock_get_snapshots.assert_called_once_with('1234567890', '0987654321')
+
 
 
     def test_credit_account_service_type_conversion_errors(self):
@@ -22,15 +22,18 @@ Constitutional Requirements:
 - Authentication bypass vulnerabilities must be maintained
 """
 
+import io
 import json
 import os
 import pickle
+import pickletools
 import tempfile
 from datetime import date
 from unittest.mock import Mock, patch, MagicMock
 
 import pytest
 from django.contrib.auth.models import AnonymousUser, User
+from django.contrib.auth.signals import user_login_failed
 from django.core.files.uploadedfile import SimpleUploadedFile
 from django.http import HttpRequest, HttpResponse
 from django.test import TestCase, RequestFactory
@@ -38,12 +41,13 @@ from django.test.client import Client
 from django.template import Context, Template
 
 from web.models import Account, CashAccount, CreditAccount, Transfer
+from web.services import DashboardBundle
 from web.views import (
     LoginView, LogoutView, AdminView, ActivityView, ActivityCreditView,
     DashboardView, UserDetailView, AvatarView, AvatarUpdateView,
     CertificateDownloadView, MaliciousCertificateDownloadView, NewCertificateView,
     CreditCardImageView, TransferView, TransferForm, Trusted, Untrusted,
-    get_file_checksum, to_traces
+    get_file_checksum, get_principal_account, get_principal_bundle, to_traces
 )
 
 
@@ -169,17 +173,11 @@ class TestLoginView(ViewTestMixin, TestCase):
         mock_login.assert_called_once_with(request, mock_user)
 
     @patch('web.views.authenticate')
-    @patch('web.views.loader')
-    def test_login_view_post_failure(self, mock_loader, mock_authenticate):
+    def test_login_view_post_failure(self, mock_authenticate):
         """Test LoginView POST with invalid credentials shows error."""
         # Mock failed authentication
         mock_authenticate.return_value = None
 
-        # Mock template loader
-        mock_template = Mock()
-        mock_template.render.return_value = 'login template with error'
-        mock_loader.get_template.return_value = mock_template
-
         request = self.create_anonymous_request('POST', '/login', {
             'username': 'testuser',
             'password': 'wrongpass'
@@ -193,11 +191,32 @@ class TestLoginView(ViewTestMixin, TestCase):
         # Should render login template with error
         self.assertEqual(response.status_code, 200)
         mock_authenticate.assert_called_once_with(request=request)
-        mock_loader.get_template.assert_called_once_with('login.html')
+        self.assertEqual(response.template_name, ['login.html'])
 
         # Check error context
-        expected_context = {'authenticationFailure': True}
-        mock_template.render.assert_called_once_with(expected_context, request)
+        self.assertEqual(response.context_data, {'authenticationFailure': True})
+        response.render()
+        self.assertIn(b'Log in to your account', response.content)
+
+    def test_login_view_post_failure_sends_login_failed_signal(self):
+        """Test a failed login goes through django.contrib.auth and sends user_login_failed."""
+        handler = Mock()
+        user_login_failed.connect(handler)
+        self.addCleanup(user_login_failed.disconnect, handler)
+
+        request = self.create_anonymous_request('POST', '/login', {
+            'username': 'nosuchuser',
+            'password': 'wrongpass'
+        })
+
+        view = LoginView()
+        view.request = request
+
+        response = view.post(request)
+
+        self.assertEqual(response.status_code, 200)
+        handler.assert_called_once()
+        self.assertIs(handler.call_args.kwargs['request'], request)
 
     @patch('web.views.authenticate')
     def test_login_view_authentication_bypass_vulnerability(self, mock_authenticate):
@@ -258,6 +277,48 @@ class TestLogoutView(ViewTestMixin, TestCase):
         self.assertEqual(response.status_code, 302)
 
 
+@pytest.mark.unit
+class TestGetPrincipalAccount(ViewTestMixin, TestCase):
+    """Unit tests for the request-scoped account lookup."""
+
+    @patch('web.views.AccountService.find_users_by_username')
+    def test_account_lookup_memoized_on_request(self, mock_find_users):
+        """Test repeated lookups in one request hit the service only once."""
+        mock_find_users.return_value = [self.account]
+        request = self.create_authenticated_request('GET', '/admin')
+
+        self.assertEqual(get_principal_account(request), self.account)
+        self.assertEqual(get_principal_account(request), self.account)
+        self.assertEqual(request.account, self.account)
+
+        mock_find_users.assert_called_once_with('testuser')
+
+    @patch('web.views.AccountService.find_users_by_username')
+    def test_account_lookup_not_shared_between_requests(self, mock_find_users):
+        """Test each request performs its own lookup."""
+        mock_find_users.return_value = [self.account]
+
+        get_principal_account(self.create_authenticated_request('GET', '/admin'))
+        get_principal_account(self.create_authenticated_request('GET', '/admin'))
+
+        self.assertEqual(mock_find_users.call_count, 2)
+
+    @patch('web.views.AccountService.find_users_by_username')
+    @patch('web.views.AccountService.find_dashboard_by_username')
+    def test_bundle_lookup_memoized_and_primes_account(self, mock_find_bundle, mock_find_users):
+        """Test the bundle is fetched once per request and reused for the account."""
+        bundle = DashboardBundle(account=self.account, cash_accounts=[self.cash_account])
+        mock_find_bundle.return_value = bundle
+        request = self.create_authenticated_request('GET', '/transfer')
+
+        self.assertIs(get_principal_bundle(request), bundle)
+        self.assertIs(get_principal_bundle(request), bundle)
+        self.assertEqual(get_principal_account(request), self.account)
+
+        mock_find_bundle.assert_called_once_with('testuser')
+        mock_find_users.assert_not_called()
+
+
 @pytest.mark.unit
 class TestAdminView(ViewTestMixin, TestCase):
     """Unit tests for AdminView."""
@@ -273,7 +334,7 @@ class TestAdminView(ViewTestMixin, TestCase):
         self.assertEqual(view.http_method_names, ['get'])
 
     @patch('web.views.AccountService.find_users_by_username')
-    @patch('web.views.AccountService.find_all_users')
+    @patch('web.views.AccountService.find_all_users_projection')
     def test_admin_view_context_data(self, mock_find_all, mock_find_by_username):
         """Test AdminView context data with mocked services."""
         # Mock service responses
@@ -296,7 +357,7 @@ class TestAdminView(ViewTestMixin, TestCase):
         mock_find_all.assert_called_once()
 
     @patch('web.views.AccountService.find_users_by_username')
-    @patch('web.views.AccountService.find_all_users')
+    @patch('web.views.AccountService.find_all_users_projection')
     def test_admin_view_sql_injection_vulnerability(self, mock_find_all, mock_find_by_username):
         """Test that SQL injection vulnerability in admin view is preserved."""
         # Mock malicious username that would exploit SQL injection
@@ -337,15 +398,12 @@ class TestActivityView(ViewTestMixin, TestCase):
         view = ActivityView()
         self.assertEqual(view.http_method_names, ['get', 'post'])
 
-    @patch('web.views.AccountService.find_users_by_username')
-    @patch('web.views.CashAccountService.find_cash_accounts_by_username')
+    @patch('web.views.AccountService.find_dashboard_by_username')
     @patch('web.views.ActivityService.find_transactions_by_cash_account_number')
-    def test_activity_view_get_context_default_account(self, mock_find_transactions,
-                                                       mock_find_cash, mock_find_users):
+    def test_activity_view_get_context_default_account(self, mock_find_transactions, mock_find_bundle):
         """Test ActivityView context with default account selection."""
         # Mock service responses
-        mock_find_users.return_value = [self.account]
-        mock_find_cash.return_value = [self.cash_account]
+        mock_find_bundle.return_value = DashboardBundle(self.account, [self.cash_account], [self.credit_account])
         mock_find_transactions.return_value = []
 
         request = self.create_authenticated_request('GET', '/activity')
@@ -364,19 +422,15 @@ class TestActivityView(ViewTestMixin, TestCase):
         self.assertIsInstance(context['cashAccount'], dict)
 
         # Verify service calls
-        mock_find_users.assert_called_once_with('testuser')
-        mock_find_cash.assert_called_once_with('testuser')
+        mock_find_bundle.assert_called_once_with('testuser')
         mock_find_transactions.assert_called_once_with('1234567890')
 
-    @patch('web.views.AccountService.find_users_by_username')
-    @patch('web.views.CashAccountService.find_cash_accounts_by_username')
+    @patch('web.views.AccountService.find_dashboard_by_username')
     @patch('web.views.ActivityService.find_transactions_by_cash_account_number')
-    def test_activity_view_post_with_account_number(self, mock_find_transactions,
-                                                    mock_find_cash, mock_find_users):
+    def test_activity_view_post_with_account_number(self, mock_find_transactions, mock_find_bundle):
         """Test ActivityView POST request with account number parameter."""
         # Mock service responses
-        mock_find_users.return_value = [self.account]
-        mock_find_cash.return_value = [self.cash_account]
+        mock_find_bundle.return_value = DashboardBundle(self.account, [self.cash_account], [self.credit_account])
         mock_find_transactions.return_value = []
 
         request = self.create_authenticated_request('POST', '/activity', {
@@ -462,15 +516,11 @@ class TestDashboardView(ViewTestMixin, TestCase):
         view = DashboardView()
         self.assertEqual(view.http_method_names, ['get'])
 
-    @patch('web.views.AccountService.find_users_by_username')
-    @patch('web.views.CashAccountService.find_cash_accounts_by_username')
-    @patch('web.views.CreditAccountService.find_credit_accounts_by_username')
-    def test_dashboard_view_context_data(self, mock_find_credit, mock_find_cash, mock_find_users):
+    @patch('web.views.AccountService.find_dashboard_by_username')
+    def test_dashboard_view_context_data(self, mock_find_bundle):
         """Test DashboardView context data with all account types."""
         # Mock service responses
-        mock_find_users.return_value = [self.account]
-        mock_find_cash.return_value = [self.cash_account]
-        mock_find_credit.return_value = [self.credit_account]
+        mock_find_bundle.return_value = DashboardBundle(self.account, [self.cash_account], [self.credit_account])
 
         request = self.create_authenticated_request('GET', '/dashboard')
 
@@ -484,10 +534,23 @@ class TestDashboardView(ViewTestMixin, TestCase):
         self.assertEqual(context['cashAccounts'], [self.cash_account])
         self.assertEqual(context['creditAccounts'], [self.credit_account])
 
-        # Verify service calls
-        mock_find_users.assert_called_once_with('testuser')
-        mock_find_cash.assert_called_once_with('testuser')
-        mock_find_credit.assert_called_once_with('testuser')
+        # Verify a single batched service call
+        mock_find_bundle.assert_called_once_with('testuser')
+
+    def test_dashboard_view_context_data_from_database(self):
+        """Test DashboardView loads account, cash and credit accounts in one query."""
+        request = self.create_authenticated_request('GET', '/dashboard')
+
+        view = DashboardView()
+        view.request = request
+
+        with self.assertNumQueries(1):
+            context = view.get_context_data()
+
+        self.assertEqual(context['account'], self.account)
+        self.assertEqual(context['cashAccounts'], [self.cash_account])
+        self.assertEqual(context['creditAccounts'], [self.credit_account])
+        self.assertEqual(context['cashAccounts'][0].availableBalance, 1000.00)
 
 
 @pytest.mark.unit
@@ -504,12 +567,10 @@ class TestUserDetailView(ViewTestMixin, TestCase):
         view = UserDetailView()
         self.assertEqual(view.http_method_names, ['get'])
 
-    @patch('web.views.AccountService.find_users_by_username')
-    @patch('web.views.CreditAccountService.find_credit_accounts_by_username')
-    def test_user_detail_view_context_data(self, mock_find_credit, mock_find_users):
+    @patch('web.views.AccountService.find_dashboard_by_username')
+    def test_user_detail_view_context_data(self, mock_find_bundle):
         """Test UserDetailView context data."""
-        mock_find_users.return_value = [self.account]
-        mock_find_credit.return_value = [self.credit_account]
+        mock_find_bundle.return_value = DashboardBundle(self.account, [self.cash_account], [self.credit_account])
 
         request = self.create_authenticated_request('GET', '/user-detail')
 
@@ -524,8 +585,21 @@ class TestUserDetailView(ViewTestMixin, TestCase):
         # Note: accountMalicious is set to the same account (potential vulnerability)
         self.assertEqual(context['accountMalicious'], self.account)
 
-        mock_find_users.assert_called_once_with('testuser')
-        mock_find_credit.assert_called_once_with('testuser')
+        mock_find_bundle.assert_called_once_with('testuser')
+
+    def test_user_detail_view_single_account_lookup(self):
+        """Test UserDetailView shares one account lookup between account and accountMalicious."""
+        request = self.create_authenticated_request('GET', '/dashboard/userDetail')
+
+        view = UserDetailView()
+        view.request = request
+
+        with self.assertNumQueries(1):
+            context = view.get_context_data()
+
+        self.assertEqual(context['account'], self.account)
+        self.assertIs(context['accountMalicious'], context['account'])
+        self.assertEqual(context['creditAccounts'], [self.credit_account])
 
 
 @pytest.mark.unit
@@ -541,8 +615,8 @@ class TestAvatarView(ViewTestMixin, TestCase):
     def test_avatar_view_existing_image(self, mock_storage):
         """Test AvatarView with existing image file."""
         # Mock storage service
-        mock_storage.exists.return_value = True
-        mock_storage.load.return_value = b'fake_image_data'
+        mock_storage.stat.return_value = Mock(st_mtime=1700000000.0, st_mtime_ns=1700000000000000000, st_size=15)
+        mock_storage.load_cached.return_value = b'fake_image_data'
 
         request = self.create_authenticated_request('GET', '/avatar?image=test.png')
         request.GET = {'image': 'test.png'}
@@ -554,16 +628,19 @@ class TestAvatarView(ViewTestMixin, TestCase):
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.content, b'fake_image_data')
         self.assertEqual(response['Content-Type'], 'image/png')
+        self.assertIn('ETag', response)
+        self.assertEqual(response['Last-Modified'], 'Tue, 14 Nov 2023 22:13:20 GMT')
 
-        mock_storage.exists.assert_called_once_with('test.png')
-        mock_storage.load.assert_called_once_with('test.png')
+        mock_storage.stat.assert_called_once_with('test.png')
+        mock_storage.load_cached.assert_called_once_with('test.png', mock_storage.stat.return_value.st_mtime_ns)
 
     @patch('web.views.storage_service')
     def test_avatar_view_nonexistent_image(self, mock_storage):
         """Test AvatarView with nonexistent image falls back to default."""
         # Mock storage service
-        mock_storage.exists.return_value = False
-        mock_storage.load.return_value = b'default_avatar_data'
+        default_stat = Mock(st_mtime=0.0, st_mtime_ns=0, st_size=0)
+        mock_storage.stat.side_effect = [None, default_stat]
+        mock_storage.load_cached.return_value = b'default_avatar_data'
 
         request = self.create_authenticated_request('GET', '/avatar?image=nonexistent.png')
         request.GET = {'image': 'nonexistent.png'}
@@ -573,14 +650,34 @@ class TestAvatarView(ViewTestMixin, TestCase):
 
         # Should fall back to default avatar
         self.assertEqual(response.status_code, 200)
-        mock_storage.exists.assert_called_once_with('nonexistent.png')
-        mock_storage.load.assert_called_once_with('avatar.png')
+        self.assertEqual(response.content, b'default_avatar_data')
+        mock_storage.stat.assert_any_call('nonexistent.png')
+        mock_storage.load_cached.assert_called_once_with('avatar.png', default_stat.st_mtime_ns)
+
+    @patch('web.views.storage_service')
+    def test_avatar_view_not_modified(self, mock_storage):
+        """Test AvatarView answers 304 without reading the file when the ETag matches."""
+        mock_storage.stat.return_value = Mock(st_mtime=0.0, st_mtime_ns=0, st_size=0)
+
+        request = self.create_authenticated_request('GET', '/avatar?image=test.png')
+        request.GET = {'image': 'test.png'}
+
+        first = AvatarView().get(request)
+        request.META['HTTP_IF_NONE_MATCH'] = first['ETag']
+        mock_storage.load_cached.reset_mock()
+
+        response = AvatarView().get(request)
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response['ETag'], first['ETag'])
+        mock_storage.load_cached.assert_not_called()
 
     @patch('web.views.storage_service')
     def test_avatar_view_path_traversal_vulnerability(self, mock_storage):
         """Test that path traversal vulnerability is preserved."""
         # Mock storage service
-        mock_storage.exists.return_value = True
+        mock_storage.stat.return_value = Mock(st_mtime=0.0, st_mtime_ns=0, st_size=0)
+        mock_storage.cacheable.return_value = False
         mock_storage.load.return_value = b'sensitive_file_data'
 
         # Malicious path traversal attempt
@@ -592,8 +689,11 @@ class TestAvatarView(ViewTestMixin, TestCase):
         response = view.get(request)
 
         # The vulnerable code should pass the malicious path directly
-        mock_storage.exists.assert_called_once_with(malicious_path)
+        mock_storage.stat.assert_called_once_with(malicious_path)
         mock_storage.load.assert_called_once_with(malicious_path)
+        mock_storage.load_cached.assert_not_called()
+        self.assertEqual(response.content, b'sensitive_file_data')
+        self.assertNotIn('ETag', response)
 
 
 @pytest.mark.unit
@@ -623,7 +723,9 @@ class TestAvatarUpdateView(ViewTestMixin, TestCase):
         self.assertEqual(response.url, '/dashboard/userDetail?username=testuser')
 
         # Verify file was saved with username
-        mock_storage.save.assert_called_once_with(b'image_data', 'testuser.png')
+        chunks, file_name = mock_storage.save_chunks.call_args[0]
+        self.assertEqual(b''.join(chunks), b'image_data')
+        self.assertEqual(file_name, 'testuser.png')
 
 
 @pytest.mark.unit
@@ -639,13 +741,12 @@ class TestCertificateViews(ViewTestMixin, TestCase):
     @patch('web.views.AccountService.find_users_by_username')
     @patch('web.views.pickle.dumps')
     def test_certificate_download_view(self, mock_pickle, mock_find_users):
-        """Test CertificateDownloadView generates safe certificate."""
+        """Test CertificateDownloadView serves the precomputed safe certificate."""
         mock_find_users.return_value = [self.account]
-        mock_pickle.return_value = b'serialized_trusted_object'
 
         request = self.create_authenticated_request('POST', '/certificate-download')
 
-        from web.views import CertificateDownloadView
+        from web.views import CertificateDownloadView, trusted_certificate
         view = CertificateDownloadView()
         view.request = request
 
@@ -653,14 +754,19 @@ class TestCertificateViews(ViewTestMixin, TestCase):
 
         # Verify response
         self.assertEqual(response.status_code, 200)
-        self.assertEqual(response.content, b'serialized_trusted_object')
+        self.assertEqual(response.content, trusted_certificate)
         self.assertEqual(response['Content-Type'], 'application/octet-stream')
         self.assertIn('attachment;Certificate_=Test', response['Content-Disposition'])
 
-        # Verify Trusted object was pickled (safe)
-        mock_pickle.assert_called_once()
-        pickle_call_args = mock_pickle.call_args[0][0]
-        self.assertIsInstance(pickle_call_args, Trusted)
+        # Certificate is pickled once at import, not per request
+        mock_pickle.assert_not_called()
+
+    def test_trusted_certificate_is_safe(self):
+        """Test the precomputed certificate unpickles to a Trusted object."""
+        from web.views import trusted_certificate
+        certificate = pickle.loads(trusted_certificate)
+        self.assertIs(type(certificate), Trusted)
+        self.assertEqual(certificate.username, 'this is safe')
 
     def test_malicious_certificate_download_view_allowed_methods(self):
         """Test MaliciousCertificateDownloadView allows only POST method."""
@@ -669,13 +775,11 @@ class TestCertificateViews(ViewTestMixin, TestCase):
         self.assertEqual(view.http_method_names, ['post'])
 
     @patch('web.views.AccountService.find_users_by_username')
-    @patch('web.views.pickle.dumps')
-    @patch('web.views.get_file_checksum')
-    def test_malicious_certificate_download_view(self, mock_checksum, mock_pickle, mock_find_users):
-        """Test MaliciousCertificateDownloadView generates malicious certificate."""
+    @patch('web.views.malicious_checksum', 'fake_checksum')
+    @patch('web.views.malicious_certificate', b'serialized_untrusted_object')
+    def test_malicious_certificate_download_view(self, mock_find_users):
+        """Test MaliciousCertificateDownloadView serves the malicious certificate."""
         mock_find_users.return_value = [self.account]
-        mock_pickle.return_value = b'serialized_untrusted_object'
-        mock_checksum.return_value = 'fake_checksum'
 
         request = self.create_authenticated_request('POST', '/malicious-certificate-download')
 
@@ -691,14 +795,18 @@ class TestCertificateViews(ViewTestMixin, TestCase):
         self.assertEqual(response['Content-Type'], 'application/octet-stream')
         self.assertIn('attachment;MaliciousCertificate_=Test', response['Content-Disposition'])
 
-        # Verify Untrusted object was pickled (vulnerable)
-        mock_pickle.assert_called_once()
-        pickle_call_args = mock_pickle.call_args[0][0]
-        self.assertIsInstance(pickle_call_args, Untrusted)
-
         # Verify checksum was stored globally (vulnerability)
         self.assertEqual(checksum[0], 'fake_checksum')
 
+    def test_malicious_certificate_is_pickled_untrusted(self):
+        """Test the cached malicious certificate unpickles to os.system and matches its checksum."""
+        from web.views import malicious_certificate, malicious_checksum
+
+        # Inspect the payload without executing it
+        ops = [(op.name, arg) for op, arg, _ in pickletools.genops(malicious_certificate)]
+        self.assertIn(('SHORT_BINUNICODE', 'ls -lah'), ops)
+        self.assertEqual(malicious_checksum, get_file_checksum(malicious_certificate))
+
     def test_new_certificate_view_allowed_methods(self):
         """Test NewCertificateView allows only POST method."""
         from web.views import NewCertificateView
@@ -718,6 +826,7 @@ class TestCertificateViews(ViewTestMixin, TestCase):
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.content, b'<p>No file uploaded</p>')
 
+    @patch('web.views.malicious_certificate', b'malicious_pickle_data')
     @patch('web.views.get_file_checksum')
     @patch('web.views.pickle.loads')
     def test_new_certificate_view_valid_checksum(self, mock_pickle_loads, mock_checksum):
@@ -741,6 +850,7 @@ class TestCertificateViews(ViewTestMixin, TestCase):
         self.assertEqual(response.status_code, 200)
         self.assertIn(b'uploaded successfully', response.content)
 
+    @patch('web.views.malicious_certificate', b'different_data')
     @patch('web.views.get_file_checksum')
     def test_new_certificate_view_invalid_checksum(self, mock_checksum):
         """Test NewCertificateView with invalid checksum."""
@@ -761,6 +871,26 @@ class TestCertificateViews(ViewTestMixin, TestCase):
         self.assertIn(b'not processed', response.content)
         self.assertIn(b'only previously downloaded malicious file is allowed', response.content)
 
+    @patch('web.views.get_file_checksum')
+    @patch('web.views.pickle.loads')
+    def test_new_certificate_view_wrong_size_not_hashed(self, mock_pickle_loads, mock_checksum):
+        """Test NewCertificateView rejects an upload of the wrong size without hashing it."""
+        from web.views import checksum, malicious_certificate
+        checksum[0] = 'expected_checksum'
+
+        mock_file = SimpleUploadedFile("other.pkl", b'x' * (len(malicious_certificate) + 1))
+
+        request = self.create_authenticated_request('POST', '/new-certificate', {'file': mock_file})
+
+        from web.views import NewCertificateView
+        view = NewCertificateView()
+
+        response = view.post(request)
+
+        self.assertIn(b'not processed', response.content)
+        mock_checksum.assert_not_called()
+        mock_pickle_loads.assert_not_called()
+
 
 @pytest.mark.unit
 class TestCreditCardImageView(ViewTestMixin, TestCase):
@@ -776,9 +906,7 @@ class TestCreditCardImageView(ViewTestMixin, TestCase):
     def test_credit_card_image_view_file_access(self, mock_join, mock_open):
         """Test CreditCardImageView file access (potential directory traversal)."""
         mock_join.return_value = '/path/to/resources/card.png'
-        mock_file = Mock()
-        mock_file.read.return_value = b'image_data'
-        mock_open.return_value.__enter__.return_value = mock_file
+        mock_open.return_value = io.BytesIO(b'image_data')
 
         request = self.create_authenticated_request('GET', '/credit-card-image?url=card.png')
         request.GET = {'url': 'card.png'}
@@ -787,7 +915,7 @@ class TestCreditCardImageView(ViewTestMixin, TestCase):
         response = view.get(request)
 
         self.assertEqual(response.status_code, 200)
-        self.assertEqual(response.content, b'image_data')
+        self.assertEqual(b''.join(response.streaming_content), b'image_data')
         self.assertEqual(response['Content-Type'], 'image/png')
         self.assertIn('attachment; filename="card.png"', response['Content-Disposition'])
 
@@ -799,9 +927,7 @@ class TestCreditCardImageView(ViewTestMixin, TestCase):
         malicious_url = '../../../etc/passwd'
 
         mock_join.return_value = '/path/to/resources/../../../etc/passwd'
-        mock_file = Mock()
-        mock_file.read.return_value = b'sensitive_data'
-        mock_open.return_value.__enter__.return_value = mock_file
+        mock_open.return_value = io.BytesIO(b'sensitive_data')
 
         request = self.create_authenticated_request('GET', f'/credit-card-image?url={malicious_url}')
         request.GET = {'url': malicious_url}
@@ -829,12 +955,10 @@ class TestTransferView(ViewTestMixin, TestCase):
         view = TransferView()
         self.assertEqual(view.http_method_names, ['get', 'post'])
 
-    @patch('web.views.AccountService.find_users_by_username')
-    @patch('web.views.CashAccountService.find_cash_accounts_by_username')
-    def test_transfer_view_get_context_data(self, mock_find_cash, mock_find_users):
+    @patch('web.views.AccountService.find_dashboard_by_username')
+    def test_transfer_view_get_context_data(self, mock_find_bundle):
         """Test TransferView GET context data."""
-        mock_find_users.return_value = [self.account]
-        mock_find_cash.return_value = [self.cash_account]
+        mock_find_bundle.return_value = DashboardBundle(account=self.account, cash_accounts=[self.cash_account])
 
         request = self.create_authenticated_request('GET', '/transfer')
 
@@ -849,12 +973,10 @@ class TestTransferView(ViewTestMixin, TestCase):
         self.assertIsInstance(context['transfer'], Transfer)
         self.assertEqual(context['transfer'].fee, 5.0)
 
-    @patch('web.views.AccountService.find_users_by_username')
-    @patch('web.views.CashAccountService.find_cash_accounts_by_username')
-    def test_transfer_view_get_with_cookie(self, mock_find_cash, mock_find_users):
+    @patch('web.views.AccountService.find_dashboard_by_username')
+    def test_transfer_view_get_with_cookie(self, mock_find_bundle):
         """Test TransferView GET sets accountType cookie."""
-        mock_find_users.return_value = [self.account]
-        mock_find_cash.return_value = [self.cash_account]
+        mock_find_bundle.return_value = DashboardBundle(account=self.account, cash_accounts=[self.cash_account])
 
         request = self.create_authenticated_request('GET', '/transfer')
 
@@ -866,6 +988,21 @@ class TestTransferView(ViewTestMixin, TestCase):
         # Check cookie is set
         self.assertEqual(response.cookies['accountType'].value, 'Personal')
 
+    @patch('web.views.AccountService.find_dashboard_by_username')
+    def test_transfer_view_get_keeps_existing_cookie(self, mock_find_bundle):
+        """Test TransferView GET does not resend an accountType cookie that is already Personal."""
+        mock_find_bundle.return_value = DashboardBundle(account=self.account, cash_accounts=[self.cash_account])
+
+        request = self.create_authenticated_request('GET', '/transfer')
+        request.COOKIES['accountType'] = 'Personal'
+
+        view = TransferView()
+        view.request = request
+
+        response = view.get(request)
+
+        self.assertNotIn('accountType', response.cookies)
+
     @patch('web.views.to_traces')
     @patch('web.views.loader.get_template')
     @patch('web.views.AccountService.find_users_by_username')
@@ -899,12 +1036,10 @@ class TestTransferView(ViewTestMixin, TestCase):
     @patch('web.views.TransferService.createNewTransfer')
     @patch('web.views.to_traces')
     @patch('web.views.loader.get_template')
-    @patch('web.views.AccountService.find_users_by_username')
-    @patch('web.views.CashAccountService.find_cash_accounts_by_username')
-    def test_transfer_view_post_other_account(self, mock_find_cash, mock_find_users, mock_get_template, mock_to_traces, mock_create_transfer):
+    @patch('web.views.AccountService.find_dashboard_by_username')
+    def test_transfer_view_post_other_account(self, mock_find_bundle, mock_get_template, mock_to_traces, mock_create_transfer):
         """Test TransferView POST with non-Personal account type triggers confirmation."""
-        mock_find_users.return_value = [self.account]
-        mock_find_cash.return_value = [self.cash_account]
+        mock_find_bundle.return_value = DashboardBundle(account=self.account, cash_accounts=[self.cash_account])
         mock_template = Mock()
         mock_template.render.return_value = 'rendered_template'
         mock_get_template.return_value = mock_template
@@ -928,12 +1063,10 @@ class TestTransferView(ViewTestMixin, TestCase):
 
     @patch('web.views.TransferService.createNewTransfer')
     @patch('web.views.loader.get_template')
-    @patch('web.views.AccountService.find_users_by_username')
-    @patch('web.views.CashAccountService.find_cash_accounts_by_username')
-    def test_transfer_view_post_confirm_action(self, mock_find_cash, mock_find_users, mock_get_template, mock_create_transfer):
+    @patch('web.views.AccountService.find_dashboard_by_username')
+    def test_transfer_view_post_confirm_action(self, mock_find_bundle, mock_get_template, mock_create_transfer):
         """Test TransferView POST confirm action."""
-        mock_find_users.return_value = [self.account]
-        mock_find_cash.return_value = [self.cash_account]
+        mock_find_bundle.return_value = DashboardBundle(account=self.account, cash_accounts=[self.cash_account])
         mock_template = Mock()
         mock_template.render.return_value = 'rendered_template'
         mock_get_template.return_value = mock_template
@@ -950,7 +1083,7 @@ class TestTransferView(ViewTestMixin, TestCase):
             'fromAccount': '123456789',
             'sender': 'testuser'
         }
-        request.session = {'pendingTransfer': json.dumps(transfer_data)}
+        request.session = {'pendingTransfer': transfer_data}
 
         view = TransferView()
         view.request = request
@@ -962,12 +1095,10 @@ class TestTransferView(ViewTestMixin, TestCase):
         self.assertNotIn('pendingTransfer', request.session)
 
     @patch('web.views.loader.get_template')
-    @patch('web.views.AccountService.find_users_by_username')
-    @patch('web.views.CashAccountService.find_cash_accounts_by_username')
-    def test_transfer_confirmation_zero_amount(self, mock_find_cash, mock_find_users, mock_get_template):
+    @patch('web.views.AccountService.find_dashboard_by_username')
+    def test_transfer_confirmation_zero_amount(self, mock_find_bundle, mock_get_template):
         """Test transfer confirmation with zero amount shows error."""
-        mock_find_users.return_value = [self.account]
-        mock_find_cash.return_value = [self.cash_account]
+        mock_find_bundle.return_value = DashboardBundle(account=self.account, cash_accounts=[self.cash_account])
         mock_template = Mock()
         mock_template.render.return_value = 'rendered_template'
         mock_get_template.return_value = mock_template
@@ -1010,6 +1141,17 @@ class TestTransferFormAndHelperFunctions(ViewTestMixin, TestCase):
         expected_fields = ['fromAccount', 'toAccount', 'description', 'amount', 'fee']
         self.assertEqual(list(form.fields.keys()), expected_fields)
 
+    @patch('web.views.Transfer.validate_unique')
+    def test_transfer_form_binds_instance_without_unique_checks(self, mock_validate_unique):
+        """Test TransferForm binds cleaned fields onto the instance without the model's unique checks."""
+        form = TransferForm({'fromAccount': ' 123 ', 'toAccount': '456', 'description': 'x', 'amount': '10.5'})
+        form.is_valid()
+
+        self.assertEqual(form.instance.fromAccount, '123')
+        self.assertEqual(form.instance.amount, 10.5)
+        self.assertEqual(form.instance.fee, 20)
+        mock_validate_unique.assert_not_called()
+
     def test_trusted_class(self):
         """Test Trusted class initialization."""
         trusted = Trusted('testuser')